@@ -2,7 +2,11 @@
 module.exports = {
   preset: 'ts-jest',
   testEnvironment: 'node',
-  setupFiles: ['dotenv/config'],
+  // Reset mock call history before every test (replaces per-file clearAllMocks hooks)
+  clearMocks: true,
+  // Test files share no global state (env cases parse explicit objects, Supabase is
+  // mocked per file), so spread them across every core instead of cores - 1
+  maxWorkers: '100%',
   setupFilesAfterEnv: ['<rootDir>/tests/setup.ts'],
   roots: ['<rootDir>/tests'],
   moduleNameMapper: {
@@ -1,6 +1,6 @@
 // Load environment variables FIRST before any other imports
 import dotenv from 'dotenv';
-dotenv.config();
+dotenv.config({ quiet: true });
 
 // Log environment status immediately
 console.log('[Startup] Environment check:');
@@ -13,6 +13,7 @@ console.log('  - ALLOWED_ORIGINS:', process.env.ALLOWED_ORIGINS || '(not set)');
 import { buildApp, getAllowedOrigins } from './app';
 import { SchedulerService } from './lib/scheduler';
 import { logger } from './lib/logger';
+import { closeBrowser, getBrowser } from './lib/browser';
 
 // Server startup
 const PORT = parseInt(process.env.PORT || '3001', 10);
@@ -43,6 +44,22 @@ const start = async () => {
       },
       '🚀 Server started successfully'
     );
+
+    // Warm the shared browser so the first scan doesn't pay Chromium's launch cost.
+    // Non-fatal: on failure getBrowser() retries on the first scan instead.
+    getBrowser().catch((err) => {
+      app.log.warn({ err }, 'Browser prewarm failed; it will be launched on first scan');
+    });
+
+    // Graceful shutdown: stop accepting requests, then release the shared browser
+    const shutdown = async (signal: string) => {
+      app.log.info({ signal }, 'Shutting down');
+      await app.close();
+      await closeBrowser();
+      process.exit(0);
+    };
+    process.once('SIGTERM', () => void shutdown('SIGTERM'));
+    process.once('SIGINT', () => void shutdown('SIGINT'));
   } catch (err) {
     console.error('CRITICAL STARTUP ERROR:', err);
     logger.fatal({ err }, 'Failed to start server');
@@ -0,0 +1,59 @@
+import { chromium, Browser } from 'playwright';
+import { logger } from './logger';
+
+/**
+ * Shared Chromium instance.
+ * Launching a browser costs hundreds of milliseconds and a fresh process per scan,
+ * so scans share one lazily launched browser and isolate themselves with contexts.
+ */
+let browserPromise: Promise<Browser> | null = null;
+
+function launchBrowser(): Promise<Browser> {
+  // Use system Chromium in production (Docker), download in development
+  const executablePath = process.env.PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH;
+  return chromium.launch({
+    executablePath: executablePath || undefined,
+    args: executablePath ? ['--no-sandbox', '--disable-setuid-sandbox'] : [],
+  });
+}
+
+/**
+ * Returns the shared browser, launching it on first use.
+ * Concurrent callers await the same launch; a crashed browser is relaunched on next call.
+ */
+export function getBrowser(): Promise<Browser> {
+  if (!browserPromise) {
+    const launching: Promise<Browser> = launchBrowser().then(
+      (browser) => {
+        browser.on('disconnected', () => {
+          if (browserPromise === launching) {
+            logger.warn('[Browser] Chromium disconnected, will relaunch on next scan');
+            browserPromise = null;
+          }
+        });
+        return browser;
+      },
+      (err) => {
+        if (browserPromise === launching) browserPromise = null;
+        throw err;
+      }
+    );
+    browserPromise = launching;
+  }
+  return browserPromise;
+}
+
+/**
+ * Closes the shared browser (graceful shutdown).
+ */
+export async function closeBrowser(): Promise<void> {
+  if (!browserPromise) return;
+  const pending = browserPromise;
+  browserPromise = null;
+  try {
+    const browser = await pending;
+    await browser.close();
+  } catch {
+    // Launch failed or browser already gone - nothing to close
+  }
+}
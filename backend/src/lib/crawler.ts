@@ -1,10 +1,11 @@
-import { chromium, Browser, Page } from 'playwright';
-import { supabase } from './supabase';
+import { BrowserContext, Page } from 'playwright';
+import { supabase, insertInBatches } from './supabase';
 import { URL } from 'url';
 import { URLNormalizer } from './normalizer';
-import { TechnologyFingerprinter, Technology } from './fingerprinter';
+import { FingerprintResult, TechnologyFingerprinter } from './fingerprinter';
 import { RobotsService } from './robots';
 import { logger } from './logger';
+import { getBrowser } from './browser';
 
 export interface ScanConfig {
   scanType?: 'quick' | 'standard' | 'deep';
@@ -41,6 +42,102 @@ export interface ScanConfig {
   concurrency?: number;
 }
 
+// <loc> entries in sitemap.xml; the capture group yields the bare URL
+const SITEMAP_LOC_PATTERN = /<loc>\s*(.*?)\s*<\/loc>/g;
+
+// Static-asset requests aborted during crawling
+const BLOCKED_RESOURCES_GLOB = '**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2,mp4,webm}';
+
+// Login form heuristics used by authenticate()
+const AUTH_SELECTORS = {
+  user: ['input[name="user"]', 'input[name="username"]', 'input[type="email"]', '#username', '#email'],
+  pass: ['input[name="password"]', 'input[type="password"]', '#password'],
+  submit: [
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Login")',
+    'button:has-text("Sign In")',
+  ],
+};
+
+// Well-known sensitive files checked at the site root
+const PROBE_FILES = ['/.env', '/.git/HEAD', '/wp-config.php.bak', '/backup.sql', '/package.json'];
+
+// Passive content checks
+const EMAIL_PATTERN = /[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/g;
+const LEGACY_JQUERY_PATTERN = /jquery[.-]1\.[0-9]/;
+const SENSITIVE_COMMENT_PATTERN = /TODO|FIXME|password|secret|key/i;
+
+// scan_logs are written in batches: flushed at this size, or after the interval
+const LOG_BATCH_SIZE = 20;
+const LOG_FLUSH_INTERVAL_MS = 1000;
+
+// Reject if `promise` hasn't settled within `ms`. The timer is always cleared, so
+// completed pages don't leave pending timeouts (and their closures) behind.
+function withTimeout<T>(promise: Promise<T>, ms: number, message: string): Promise<T> {
+  let timer: NodeJS.Timeout | undefined;
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => reject(new Error(message)), ms);
+  });
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+}
+
+/**
+ * Distinct absolute http(s) URLs of the given anchors. Runs inside the page via $$eval,
+ * so it must stay self-contained. Reads the href attribute rather than the property:
+ * on SVG <a> elements `.href` is an SVGAnimatedString, not a string.
+ */
+export function collectPageLinks(anchors: Element[]): string[] {
+  const links = new Set<string>();
+  for (const anchor of anchors) {
+    const raw = anchor.getAttribute('href');
+    if (raw === null) continue;
+
+    let href: string;
+    try {
+      // globalThis.URL, not the imported 'url' module binding, which doesn't exist in the page
+      href = new globalThis.URL(raw, anchor.baseURI).href;
+    } catch {
+      continue;
+    }
+    if (href.startsWith('http:') || href.startsWith('https:')) links.add(href);
+  }
+  return Array.from(links);
+}
+
+// Polyglots & Payloads for the enabled active-fuzzing vectors (fixed for a whole scan)
+function buildFuzzPayloads(config: ScanConfig): string[] {
+  const payloads: string[] = [];
+  if (config.vectorSQLi) payloads.push("' OR '1'='1");
+  if (config.vectorXSS) payloads.push("<script>console.log('VULN_XSS')</script>");
+  if (config.vectorLFI) payloads.push('../../../../etc/passwd');
+  if (config.vectorCmdInj) payloads.push('| whoami');
+  return payloads;
+}
+
+// Stateless helpers shared by every scan: signature tables and URL rule sets are
+// built once per process, and robots.txt verdicts stay cached across scans.
+const sharedNormalizer = new URLNormalizer();
+const sharedFingerprinter = new TechnologyFingerprinter();
+const sharedRobotsService = new RobotsService();
+
+interface FindingInput {
+  title: string;
+  description: string;
+  severity: 'critical' | 'high' | 'medium' | 'low' | 'info';
+  location: string;
+  evidence?: string;
+  remediation?: string;
+  cwe_id?: string;
+}
+
+interface ScanLogRow {
+  scan_id: string;
+  message: string;
+  level: 'info' | 'warn' | 'error' | 'success';
+  timestamp: string;
+}
+
 interface ScanQueueItem {
   url: string;
   depth: number;
@@ -53,6 +150,9 @@ export class CrawlerService {
   private projectId: string = '';
   private config: ScanConfig = {};
   private pagesScanned = 0;
+  private fuzzPayloads: string[] = [];
+  private logBuffer: ScanLogRow[] = [];
+  private logFlushTimer: NodeJS.Timeout | null = null;
 
   // New Modules
   private normalizer: URLNormalizer;
@@ -60,21 +160,34 @@ export class CrawlerService {
   private robotsService: RobotsService;
 
   // Blocked IP patterns for SSRF protection
-  private static readonly BLOCKED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0', '::1', '[::1]'];
-
-  private static readonly BLOCKED_IP_PATTERNS = [
-    /^10\./, // 10.0.0.0/8 (Class A private)
-    /^172\.(1[6-9]|2[0-9]|3[01])\./, // 172.16.0.0/12 (Class B private)
-    /^192\.168\./, // 192.168.0.0/16 (Class C private)
-    /^169\.254\./, // Link-local
-    /^127\./, // Loopback
-    /^0\./, // Current network
-  ];
+  private static readonly BLOCKED_HOSTS: ReadonlySet<string> = new Set([
+    'localhost',
+    '127.0.0.1',
+    '0.0.0.0',
+    '::1',
+    '[::1]',
+  ]);
+
+  private static readonly ALLOWED_PROTOCOLS: ReadonlySet<string> = new Set(['http:', 'https:']);
+
+  // Private IPv4 ranges, as one anchored alternation so a hostname is tested once
+  private static readonly BLOCKED_IP_PATTERN = new RegExp(
+    '^(?:' +
+      [
+        '10\\.', // 10.0.0.0/8 (Class A private)
+        '172\\.(?:1[6-9]|2[0-9]|3[01])\\.', // 172.16.0.0/12 (Class B private)
+        '192\\.168\\.', // 192.168.0.0/16 (Class C private)
+        '169\\.254\\.', // Link-local
+        '127\\.', // Loopback
+        '0\\.', // Current network
+      ].join('|') +
+      ')'
+  );
 
   constructor() {
-    this.normalizer = new URLNormalizer();
-    this.fingerprinter = new TechnologyFingerprinter();
-    this.robotsService = new RobotsService();
+    this.normalizer = sharedNormalizer;
+    this.fingerprinter = sharedFingerprinter;
+    this.robotsService = sharedRobotsService;
   }
 
   /**
@@ -87,7 +200,7 @@ export class CrawlerService {
       const hostname = parsed.hostname.toLowerCase();
 
       // Block localhost and common internal hostnames
-      if (CrawlerService.BLOCKED_HOSTS.includes(hostname)) {
+      if (CrawlerService.BLOCKED_HOSTS.has(hostname)) {
         return { safe: false, reason: `Blocked host: ${hostname}` };
       }
 
@@ -101,14 +214,12 @@ export class CrawlerService {
       }
 
       // Block private IP ranges
-      for (const pattern of CrawlerService.BLOCKED_IP_PATTERNS) {
-        if (pattern.test(hostname)) {
-          return { safe: false, reason: `Blocked private IP: ${hostname}` };
-        }
+      if (CrawlerService.BLOCKED_IP_PATTERN.test(hostname)) {
+        return { safe: false, reason: `Blocked private IP: ${hostname}` };
       }
 
       // Block non-http(s) protocols
-      if (!['http:', 'https:'].includes(parsed.protocol)) {
+      if (!CrawlerService.ALLOWED_PROTOCOLS.has(parsed.protocol)) {
         return { safe: false, reason: `Blocked protocol: ${parsed.protocol}` };
       }
 
@@ -123,12 +234,35 @@ export class CrawlerService {
     const pinoLevel = level === 'success' ? 'info' : level;
     logger[pinoLevel]({ scanId: this.scanId }, `[Scanner] ${message}`);
 
-    await supabase.from('scan_logs').insert({
+    // Buffered: rows are written in batches instead of one insert per message
+    this.logBuffer.push({
       scan_id: this.scanId,
       message,
       level,
       timestamp: new Date().toISOString(),
     });
+
+    if (this.logBuffer.length >= LOG_BATCH_SIZE) {
+      await this.flushLogs();
+    } else if (!this.logFlushTimer) {
+      // Keep the live console fresh when messages trickle in slowly
+      this.logFlushTimer = setTimeout(() => void this.flushLogs(), LOG_FLUSH_INTERVAL_MS);
+    }
+  }
+
+  private async flushLogs() {
+    if (this.logFlushTimer) {
+      clearTimeout(this.logFlushTimer);
+      this.logFlushTimer = null;
+    }
+    if (this.logBuffer.length === 0) return;
+
+    const rows = this.logBuffer;
+    this.logBuffer = [];
+    const { error } = await insertInBatches('scan_logs', rows);
+    if (error) {
+      logger.warn({ err: error, scanId: this.scanId }, '[Scanner] Failed to persist scan logs');
+    }
   }
 
   private async updateProgress(progress: number, action: string) {
@@ -149,12 +283,14 @@ export class CrawlerService {
     this.scanId = scanId;
     this.projectId = projectId;
     this.config = config;
+    this.fuzzPayloads = buildFuzzPayloads(config);
     this.visited.clear();
 
     // SSRF Protection: Validate URL before scanning
     const urlSafetyCheck = this.isUrlSafe(startUrl);
     if (!urlSafetyCheck.safe) {
       await this.log(`🛡️ SSRF Protection: Scan rejected - ${urlSafetyCheck.reason}`, 'error');
+      await this.flushLogs();
       await supabase
         .from('scans')
         .update({
@@ -181,19 +317,19 @@ export class CrawlerService {
     );
     await this.updateProgress(5, 'Launching engine...');
 
-    let browser: Browser | null = null;
+    let scanContext: BrowserContext | null = null;
 
     try {
-      // Use system Chromium in production (Docker), download in development
-      const executablePath = process.env.PLAYWRIGHT_CHROMIUM_EXECUTABLE_PATH;
-      browser = await chromium.launch({
-        executablePath: executablePath || undefined,
-        args: executablePath ? ['--no-sandbox', '--disable-setuid-sandbox'] : [],
-      });
+      // Scans share one browser process; each gets its own isolated context
+      const browser = await getBrowser();
       const context = await browser.newContext({
         ignoreHTTPSErrors: true,
         userAgent: userAgent,
       });
+      scanContext = context;
+
+      // Optimization: Block extensive resources (registered once, applies to every page)
+      await context.route(BLOCKED_RESOURCES_GLOB, (route) => route.abort());
 
       // 1. Authentication Check
       if (this.config.authEnabled && this.config.authLoginUrl) {
@@ -251,19 +387,18 @@ export class CrawlerService {
           // Create a promise for this page
           const p = (async () => {
             const page = await context.newPage();
-            // Optimization: Block extensive resources
-            await page.route('**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2,mp4,webm}', route => route.abort());
-            
+
             try {
               await this.updateProgress(
                 Math.min(90, Math.floor((this.pagesScanned / maxPages) * 100)),
                 `Scanning: ${url}`
               );
               // Per-page timeout: 60s max to prevent any single page from hanging
-              await Promise.race([
+              await withTimeout(
                 this.processPage(page, url, depth, maxDepth),
-                new Promise((_, reject) => setTimeout(() => reject(new Error('Page processing timeout (60s)')), 60000))
-              ]);
+                60000,
+                'Page processing timeout (60s)'
+              );
             } catch (e: any) {
               console.error(`Error scanning ${url}`, e);
             } finally {
@@ -343,6 +478,7 @@ export class CrawlerService {
       }
 
       await this.log(`Scan complete. Analyzed ${this.pagesScanned} pages.`, 'success');
+      await this.flushLogs();
       await this.updateProgress(100, 'Completed');
       await supabase
         .from('scans')
@@ -355,12 +491,14 @@ export class CrawlerService {
     } catch (error: any) {
       logger.error({ err: error, scanId: scanId }, `[Crawler] Fatal Error`);
       await this.log(`Critical Engine Error: ${error.message}`, 'error');
+      await this.flushLogs();
       await supabase
         .from('scans')
         .update({ status: 'failed', current_action: 'Failed' })
         .eq('id', scanId);
     } finally {
-      if (browser) await browser.close();
+      if (scanContext) await scanContext.close().catch(() => {});
+      await this.flushLogs();
     }
   }
 
@@ -371,25 +509,8 @@ export class CrawlerService {
 
     await page.goto(this.config.authLoginUrl, { waitUntil: 'networkidle' });
 
-    const selectors = {
-      user: [
-        'input[name="user"]',
-        'input[name="username"]',
-        'input[type="email"]',
-        '#username',
-        '#email',
-      ],
-      pass: ['input[name="password"]', 'input[type="password"]', '#password'],
-      submit: [
-        'button[type="submit"]',
-        'input[type="submit"]',
-        'button:has-text("Login")',
-        'button:has-text("Sign In")',
-      ],
-    };
-
     let userFound = false;
-    for (const sel of selectors.user) {
+    for (const sel of AUTH_SELECTORS.user) {
       if (await page.$(sel)) {
         await page.type(sel, this.config.authUsername);
         userFound = true;
@@ -398,7 +519,7 @@ export class CrawlerService {
     }
 
     let passFound = false;
-    for (const sel of selectors.pass) {
+    for (const sel of AUTH_SELECTORS.pass) {
       if (await page.$(sel)) {
         await page.type(sel, this.config.authPassword);
         passFound = true;
@@ -407,7 +528,7 @@ export class CrawlerService {
     }
 
     if (userFound && passFound) {
-      for (const sel of selectors.submit) {
+      for (const sel of AUTH_SELECTORS.submit) {
         if (await page.$(sel)) {
           await Promise.all([
             page.waitForNavigation({ timeout: 10000 }).catch(() => {}),
@@ -416,8 +537,10 @@ export class CrawlerService {
           return;
         }
       }
-      await page.keyboard.press('Enter');
-      await page.waitForTimeout(2000);
+      await Promise.all([
+        page.waitForNavigation({ timeout: 10000 }).catch(() => {}),
+        page.keyboard.press('Enter'),
+      ]);
     } else {
       throw new Error('Could not identify login fields automatically.');
     }
@@ -430,12 +553,11 @@ export class CrawlerService {
       const response = await fetch(url);
       if (response.ok) {
         const text = await response.text();
-        const locs = text.match(/<loc>(.*?)<\/loc>/g);
-        if (locs) {
+        const locs = Array.from(text.matchAll(SITEMAP_LOC_PATTERN), (m) => m[1]);
+        if (locs.length > 0) {
           await this.log(`Found ${locs.length} URLs in sitemap: ${url}`, 'info');
-          for (const locTag of locs) {
-            const cleanUrl = locTag.replace(/<\/?loc>/g, '');
-            const normalized = this.normalizer.normalizeUrl(cleanUrl);
+          for (const loc of locs) {
+            const normalized = this.normalizer.normalizeUrl(loc);
              if (
               normalized &&
               this.normalizer.isValidUrl(normalized) &&
@@ -446,6 +568,8 @@ export class CrawlerService {
             }
           }
         }
+      } else {
+        await response.body?.cancel().catch(() => {});
       }
     } catch (e) {
       // console.error('Sitemap error', e);
@@ -454,20 +578,14 @@ export class CrawlerService {
 
   // Active Fuzzing
   private async fuzzPage(page: Page, url: string) {
-    if (!this.config.vectorSQLi && !this.config.vectorXSS && !this.config.vectorLFI && !this.config.vectorCmdInj) return;
+    const payloads = this.fuzzPayloads;
+    if (payloads.length === 0) return;
 
     const forms = await page.$$('form');
     if (forms.length > 0) {
       await this.log(`Fuzzing ${forms.length} forms on ${url}`, 'info');
     }
 
-    // Polyglots & Payloads
-    const payloads = [];
-    if (this.config.vectorSQLi) payloads.push("' OR '1'='1");
-    if (this.config.vectorXSS) payloads.push("<script>console.log('VULN_XSS')</script>");
-    if (this.config.vectorLFI) payloads.push("../../../../etc/passwd");
-    if (this.config.vectorCmdInj) payloads.push("| whoami");
-
     for (const form of forms) {
       try {
         const inputs = await form.$$('input:not([type="hidden"]):not([type="submit"])');
@@ -565,8 +683,10 @@ export class CrawlerService {
       if (!setCookie) return;
 
       const cookies = Array.isArray(setCookie) ? setCookie : setCookie.split('\n');
+      const isHttps = url.startsWith('https');
       for (const cookie of cookies) {
-          if (!cookie.toLowerCase().includes('httponly')) {
+          const attributes = cookie.toLowerCase();
+          if (!attributes.includes('httponly')) {
                await this.reportFinding({
                   title: 'Cookie Missing HttpOnly',
                   description: 'Cookie set without HttpOnly flag, accessible to JS.',
@@ -576,7 +696,7 @@ export class CrawlerService {
                   cwe_id: 'CWE-1004'
               });
           }
-          if (!cookie.toLowerCase().includes('secure') && url.startsWith('https')) {
+          if (isHttps && !attributes.includes('secure')) {
                await this.reportFinding({
                   title: 'Cookie Missing Secure Flag',
                   description: 'Cookie set without Secure flag over HTTPS.',
@@ -591,8 +711,10 @@ export class CrawlerService {
 
   private async extractOSINT(content: string, url: string) {
       if (!this.config.checkOSINT) return;
-      // Emails
-      const emails = content.match(/[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/g);
+      // Emails (the regex retries its local-part run at every offset, so skip it
+      // outright when the page has no '@' at all)
+      if (!content.includes('@')) return;
+      const emails = content.match(EMAIL_PATTERN);
       if (emails) {
           const unique = [...new Set(emails)].slice(0, 10); // Check max 10
           if (unique.length > 0) {
@@ -613,30 +735,34 @@ export class CrawlerService {
   private async probeFiles(url: string) {
       if (!this.config.checkProbing) return;
       const baseUrl = new URL(url).origin;
-      const files = ['/.env', '/.git/HEAD', '/wp-config.php.bak', '/backup.sql', '/package.json'];
-      
-      for (const file of files) {
-          try {
-              const target = `${baseUrl}${file}`;
-              const res = await fetch(target);
-              if (res.ok && res.status === 200) {
-                  await this.reportFinding({
-                      title: 'Sensitive File Exposed',
-                      description: `Accessible sensitive file found: ${file}`,
-                      severity: 'high',
-                      location: target,
-                      evidence: `Status 200 OK`,
-                      cwe_id: 'CWE-538'
-                  });
-              }
-          } catch(e) {}
-      }
+
+      // Probes are independent requests to the same origin; issue them together
+      await Promise.all(
+          PROBE_FILES.map(async (file) => {
+              try {
+                  const target = `${baseUrl}${file}`;
+                  const res = await fetch(target);
+                  // Only the status matters; release the connection without downloading the file
+                  await res.body?.cancel().catch(() => {});
+                  if (res.ok && res.status === 200) {
+                      await this.reportFinding({
+                          title: 'Sensitive File Exposed',
+                          description: `Accessible sensitive file found: ${file}`,
+                          severity: 'high',
+                          location: target,
+                          evidence: `Status 200 OK`,
+                          cwe_id: 'CWE-538'
+                      });
+                  }
+              } catch(e) {}
+          })
+      );
   }
 
   private async auditLibraries(content: string, url: string) {
       if (!this.config.checkSCA) return;
-      // Simple regex checks for deprecated versions
-      if (/jquery[.-]1\.[0-9]/.test(content)) {
+      // Simple regex checks for deprecated versions, behind a plain substring probe
+      if (content.includes('jquery') && LEGACY_JQUERY_PATTERN.test(content)) {
            await this.reportFinding({
               title: 'Outdated Library: jQuery 1.x',
               description: 'Legacy jQuery version detected.',
@@ -660,29 +786,16 @@ export class CrawlerService {
     const status = response.status();
     const headers = response.headers();
     const content = await page.content();
+    // Request the title now so the browser round-trip overlaps the fingerprinting below
+    const titlePromise = page.title().catch(() => '');
 
-    // Insert Asset (Page Inventory)
-    try {
-      const pageTitle = (await page.title()) || '';
-      await supabase.from('assets').insert({
-        project_id: this.projectId,
-        scan_id: this.scanId,
-        url: url,
-        type: 'page',
-        status_code: status,
-        title: pageTitle,
-        metadata: {
-          headers: headers,
-        },
-      });
-    } catch (assetError) {
-      // Non-critical, just log
-      // console.error('[Scanner] Failed to save asset', assetError);
-    }
+    // Passive header/content findings for this page, written in one insert below
+    const passiveFindings: FindingInput[] = [];
 
-    // 0. Fingerprint Technology
+    // 0. Fingerprint Technology (before the asset insert so it carries the result)
+    let fingerprint: FingerprintResult | null = null;
     try {
-      const fingerprint = this.fingerprinter.analyze(headers, content);
+      fingerprint = this.fingerprinter.analyze(headers, content);
 
       if (fingerprint.technologies.length > 0) {
         const techNames = fingerprint.technologies.map((t) => t.name).join(', ');
@@ -690,22 +803,11 @@ export class CrawlerService {
         if (depth === 0) {
           await this.log(`Detected Technologies: ${techNames}`, 'success');
         }
-
-        // Update status of asset with technologies
-        await supabase
-          .from('assets')
-          .update({
-            metadata: {
-              headers: headers,
-              technologies: fingerprint.technologies,
-            },
-          })
-          .match({ scan_id: this.scanId, url: url });
       }
 
       // Report Security Header Issues from Fingerprinter
       if (fingerprint.securityScore < 70) {
-        await this.reportFinding({
+        passiveFindings.push({
           title: 'Weak Security Configuration',
           description: `Security Header Score is low (${fingerprint.securityScore}/100). Missing critical headers.`,
           severity: 'low',
@@ -718,10 +820,28 @@ export class CrawlerService {
       console.error('Fingerprinting failed', e);
     }
 
+    // Insert Asset (Page Inventory) with any detected technologies in the same row
+    try {
+      const pageTitle = (await titlePromise) || '';
+      const technologies = fingerprint?.technologies;
+      await supabase.from('assets').insert({
+        project_id: this.projectId,
+        scan_id: this.scanId,
+        url: url,
+        type: 'page',
+        status_code: status,
+        title: pageTitle,
+        metadata: technologies?.length ? { headers, technologies } : { headers },
+      });
+    } catch (assetError) {
+      // Non-critical, just log
+      // console.error('[Scanner] Failed to save asset', assetError);
+    }
+
     // 1. Analyze Headers (Legacy + specific checks)
     if (this.config.checkHeaders !== false) {
       if (!headers['content-security-policy']) {
-        await this.reportFinding({
+        passiveFindings.push({
           title: 'Missing Content-Security-Policy',
           description: 'CSP header is missing, increasing XSS risk.',
           severity: 'medium',
@@ -731,7 +851,7 @@ export class CrawlerService {
         });
       }
       if (!headers['x-frame-options']) {
-        await this.reportFinding({
+        passiveFindings.push({
           title: 'Missing X-Frame-Options',
           description: 'Site potentially vulnerable to Clickjacking.',
           severity: 'low',
@@ -748,7 +868,7 @@ export class CrawlerService {
       url.startsWith('https://') &&
       content.includes('http://')
     ) {
-      await this.reportFinding({
+      passiveFindings.push({
         title: 'Mixed Content Detected',
         description: 'HTTPS page loads HTTP resources.',
         severity: 'high',
@@ -759,10 +879,25 @@ export class CrawlerService {
     }
 
     if (this.config.checkComments !== false && content.includes('<!--')) {
-      const matches = content.match(/<!--(.*?)-->/g);
-      const sensitive = matches?.filter((m) => /TODO|FIXME|password|secret|key/i.test(m));
-      if (sensitive && sensitive.length > 0) {
-        await this.reportFinding({
+      // Walk the parsed DOM's comment nodes (multi-line ones included) and keep only the
+      // suspicious ones, instead of regex-scanning the serialized HTML
+      const sensitive = await page
+        .evaluate(
+          ({ source, flags }) => {
+            const pattern = new RegExp(source, flags);
+            const walker = document.createTreeWalker(document, NodeFilter.SHOW_COMMENT);
+            const found: string[] = [];
+            while (walker.nextNode()) {
+              const text = walker.currentNode.nodeValue || '';
+              if (pattern.test(text)) found.push(`<!--${text}-->`);
+            }
+            return found;
+          },
+          { source: SENSITIVE_COMMENT_PATTERN.source, flags: SENSITIVE_COMMENT_PATTERN.flags }
+        )
+        .catch(() => [] as string[]);
+      if (sensitive.length > 0) {
+        passiveFindings.push({
           title: 'Sensitive Comments Found',
           description: `Found ${sensitive.length} suspicious HTML comments.`,
           severity: 'low',
@@ -773,13 +908,12 @@ export class CrawlerService {
       }
     }
 
+    await this.reportFindings(passiveFindings);
+
     // 3. Active Fuzzing (New)
     try {
         // Wrap fuzzing with a 30s timeout to prevent hangs on slow sites
-        await Promise.race([
-          this.fuzzPage(page, url),
-          new Promise((_, reject) => setTimeout(() => reject(new Error('Fuzz timeout (30s)')), 30000))
-        ]);
+        await withTimeout(this.fuzzPage(page, url), 30000, 'Fuzz timeout (30s)');
     } catch (e) {
         // Fuzzing failed or timed out — non-fatal, continue scan
     }
@@ -806,7 +940,9 @@ export class CrawlerService {
          } catch(e) {}
       }
 
-      const hrefs = await page.$$eval('a', (as) => as.map((a) => a.href));
+      // Collect distinct absolute http(s) links inside the page, so duplicates and
+      // mailto:/javascript: anchors never cross the protocol boundary
+      const hrefs = await page.$$eval('a[href]', collectPageLinks);
 
       let newLinksCount = 0;
       for (const href of hrefs) {
@@ -829,22 +965,23 @@ export class CrawlerService {
     }
   }
 
-  private async reportFinding(finding: {
-    title: string;
-    description: string;
-    severity: 'critical' | 'high' | 'medium' | 'low' | 'info';
-    location: string;
-    evidence?: string;
-    remediation?: string;
-    cwe_id?: string;
-  }) {
-    await supabase.from('findings').insert({
-      scan_id: this.scanId,
-      ...finding,
-    });
-    await this.log(
-      `Finding: ${finding.title} (${finding.severity})`,
-      finding.severity === 'info' ? 'info' : 'warn'
+  private async reportFinding(finding: FindingInput) {
+    await this.reportFindings([finding]);
+  }
+
+  // Persist several findings with one multi-row insert
+  private async reportFindings(findings: FindingInput[]) {
+    if (findings.length === 0) return;
+
+    await insertInBatches(
+      'findings',
+      findings.map((finding) => ({ scan_id: this.scanId, ...finding }))
     );
+    for (const finding of findings) {
+      await this.log(
+        `Finding: ${finding.title} (${finding.severity})`,
+        finding.severity === 'info' ? 'info' : 'warn'
+      );
+    }
   }
 }
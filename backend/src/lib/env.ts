@@ -2,8 +2,8 @@ import { z } from 'zod';
 import dotenv from 'dotenv';
 import path from 'path';
 
-// Load environment variables from .env file
-dotenv.config({ path: path.resolve(__dirname, '../../.env') });
+// Load environment variables from .env file (quiet: dotenv 17 otherwise logs on every load)
+dotenv.config({ path: path.resolve(__dirname, '../../.env'), quiet: true });
 
 /**
  * Environment variable schema for the backend application.
@@ -19,25 +19,39 @@ const envSchema = z.object({
   // Server
   PORT: z.coerce.number().default(3001),
   NODE_ENV: z.enum(['development', 'production', 'test']).default('development'),
-  LOG_LEVEL: z.enum(['fatal', 'error', 'warn', 'info', 'debug', 'trace']).default('info'),
+  LOG_LEVEL: z.enum(['fatal', 'error', 'warn', 'info', 'debug', 'trace', 'silent']).default('info'),
 
   // Security
   ALLOWED_ORIGINS: z.string().optional(),
   RATE_LIMIT_MAX: z.coerce.number().default(100),
   RATE_LIMIT_WINDOW_MS: z.coerce.number().default(60000),
 
+  // MFA secret encryption: 32-byte AES key as hex (random per process when unset)
+  MFA_ENCRYPTION_KEY: z
+    .string()
+    .regex(/^[0-9a-fA-F]{64,}$/, 'MFA_ENCRYPTION_KEY must be at least 64 hex characters')
+    .optional(),
+
   // Monitoring
   SENTRY_DSN: z.string().url().optional(),
 });
 
 export type Env = z.infer<typeof envSchema>;
 
+/**
+ * Parses an explicit variable map against the schema without touching process state.
+ * Tests pass plain objects here instead of mutating process.env.
+ */
+export function parseEnv(source: NodeJS.ProcessEnv) {
+  return envSchema.safeParse(source);
+}
+
 /**
  * Validates environment variables against the schema.
  * Exits the process with detailed error messages if validation fails.
  */
 function validateEnv(): Env {
-  const result = envSchema.safeParse(process.env);
+  const result = parseEnv(process.env);
 
   if (!result.success) {
     console.error('');
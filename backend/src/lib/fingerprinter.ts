@@ -2,6 +2,7 @@
  * Technology fingerprinting component.
  * Ported from legacy fingerprinter.py
  */
+import { LRUCache } from './lru-cache';
 
 export interface Technology {
   name: string;
@@ -19,6 +20,12 @@ export interface Technology {
   confidence: 'high' | 'medium' | 'low';
 }
 
+export interface FingerprintResult {
+  technologies: Technology[];
+  securityHeaders: Record<string, string>;
+  securityScore: number;
+}
+
 interface Signature {
   headers?: string[];
   patterns?: RegExp[];
@@ -28,185 +35,285 @@ interface Signature {
 
 type TechSignatures = Record<string, Signature>;
 
-export class TechnologyFingerprinter {
-  private signatures: TechSignatures;
-  private securityHeaders: string[];
+const SIGNATURES: TechSignatures = {
+  // Web Servers
+  apache: {
+    headers: ['server'],
+    patterns: [/apache/i, /httpd/i],
+    category: 'web_server',
+  },
+  nginx: {
+    headers: ['server'],
+    patterns: [/nginx/i],
+    category: 'web_server',
+  },
+  iis: {
+    headers: ['server'],
+    patterns: [/microsoft-iis/i, /iis/i],
+    category: 'web_server',
+  },
+  cloudflare: {
+    headers: ['server', 'cf-ray'],
+    patterns: [/cloudflare/i],
+    category: 'cdn',
+  },
 
-  constructor() {
-    this.signatures = this._loadSignatures();
-    this.securityHeaders = [
-      'strict-transport-security',
-      'content-security-policy',
-      'x-frame-options',
-      'x-content-type-options',
-      'x-xss-protection',
-      'referrer-policy',
-      'permissions-policy',
-      'feature-policy',
-      'expect-ct',
-      'public-key-pins',
-    ];
+  // Languages
+  php: {
+    headers: ['x-powered-by', 'server'],
+    patterns: [/php/i, /\.php/i],
+    htmlPatterns: [/\.php\?/i, /\.php$/i],
+    category: 'language',
+  },
+  'asp.net': {
+    headers: ['x-powered-by', 'x-aspnet-version'],
+    patterns: [/asp\.net/i, /aspnet/i],
+    htmlPatterns: [/\.aspx/i, /__viewstate/i],
+    category: 'language',
+  },
+
+  // Frameworks
+  django: {
+    headers: ['server'],
+    patterns: [/django/i],
+    htmlPatterns: [/csrfmiddlewaretoken/i],
+    category: 'framework',
+  },
+  flask: {
+    headers: ['server'],
+    patterns: [/flask/i],
+    category: 'framework',
+  },
+  rails: {
+    headers: ['x-powered-by'],
+    patterns: [/ruby/i, /rails/i],
+    htmlPatterns: [/authenticity_token/i],
+    category: 'framework',
+  },
+  express: {
+    headers: ['x-powered-by'],
+    patterns: [/express/i],
+    category: 'framework',
+  },
+
+  // CMS
+  wordpress: {
+    htmlPatterns: [/wp-content/i, /wp-includes/i, /wordpress/i, /wp-json/i, /\/wp-admin\//i],
+    category: 'cms',
+  },
+  drupal: {
+    htmlPatterns: [/drupal/i, /\/sites\/default\//i, /drupal\.js/i],
+    category: 'cms',
+  },
+  shopify: {
+    htmlPatterns: [/shopify/i, /cdn\.shopify\.com/i, /myshopify\.com/i],
+    category: 'cms',
+  },
+
+  // JS Libs
+  jquery: {
+    htmlPatterns: [/jquery/i, /jquery\.min\.js/i],
+    category: 'javascript',
+  },
+  react: {
+    htmlPatterns: [/react/i, /react\.js/i, /react\.min\.js/i, /data-reactroot/i],
+    category: 'javascript',
+  },
+  vue: {
+    htmlPatterns: [/vue\.js/i, /vue\.min\.js/i, /v-if/i, /v-for/i],
+    category: 'javascript',
+  },
+  angular: {
+    htmlPatterns: [/angular/i, /ng-app/i, /ng-controller/i],
+    category: 'javascript',
+  },
+  bootstrap: {
+    htmlPatterns: [/bootstrap/i, /bootstrap\.css/i, /bootstrap\.js/i, /col-/i, /container/i],
+    category: 'css_framework',
+  },
+
+  // Analytics
+  google_analytics: {
+    htmlPatterns: [/google-analytics/i, /gtag/i, /ga\(/i],
+    category: 'analytics',
+  },
+};
+
+// A signature with each pattern list folded into one case-insensitive alternation.
+// Every record has the same fields (no optional keys), so the matching loop sees one
+// object shape and needs no presence checks beyond the null patterns.
+interface CompiledSignature {
+  // Position in COMPILED_SIGNATURES, used to index per-response hit flags
+  index: number;
+  name: string;
+  category: Technology['category'];
+  // Result entry reported on a match, built once instead of per detection
+  technology: Readonly<Technology>;
+  headers: readonly string[];
+  headerPattern: RegExp | null;
+  htmlPattern: RegExp | null;
+}
+
+// Pattern sources made only of plain characters and escaped punctuation
+const LITERAL_SOURCE = /^(?:[^\\^$.|?*+()[\]{}]|\\[^\w])*$/;
+
+const literalText = (p: RegExp): string | null =>
+  LITERAL_SOURCE.test(p.source) ? p.source.replace(/\\(.)/g, '$1').toLowerCase() : null;
+
+/**
+ * Drop literal patterns that contain another literal pattern of the same list
+ * (e.g. /jquery\.min\.js/ next to /jquery/): whenever they match, the shorter one does too.
+ */
+const pruneSubsumed = (patterns: RegExp[]): RegExp[] => {
+  const literals = patterns.map(literalText);
+  return patterns.filter((_, i) => {
+    const text = literals[i];
+    if (text === null) return true;
+    return !literals.some(
+      (other, j) => other !== null && j !== i && text.includes(other) && (other !== text || j < i)
+    );
+  });
+};
+
+// One regex pass per technology instead of one per pattern
+const combinePatterns = (patterns: RegExp[]): RegExp =>
+  new RegExp(
+    pruneSubsumed(patterns)
+      .map((p) => `(?:${p.source})`)
+      .join('|'),
+    'i'
+  );
+
+/**
+ * Header values are lowercased before matching, so a list of plain literals is compiled
+ * lowercase and case-sensitive rather than case-folding on every test. Lowercasing any
+ * other source would rewrite regex syntax (\S into \s, \P{..} into \p{..}), so lists
+ * with real regex syntax keep their sources as written and the i flag.
+ */
+const combineHeaderPatterns = (patterns: RegExp[]): RegExp => {
+  const kept = pruneSubsumed(patterns);
+  const allLiteral = kept.every((p) => literalText(p) !== null);
+  return new RegExp(
+    kept.map((p) => `(?:${allLiteral ? p.source.toLowerCase() : p.source})`).join('|'),
+    allLiteral ? '' : 'i'
+  );
+};
+
+// Compiled once at module load and shared by every fingerprinter instance
+const COMPILED_SIGNATURES: readonly CompiledSignature[] = Object.entries(SIGNATURES).map(
+  ([name, sig], index) => ({
+    index,
+    name,
+    category: sig.category,
+    technology: Object.freeze({ name, category: sig.category, confidence: 'medium' as const }),
+    headers: sig.headers ?? [],
+    headerPattern: sig.patterns ? combineHeaderPatterns(sig.patterns) : null,
+    htmlPattern: sig.htmlPatterns ? combinePatterns(sig.htmlPatterns) : null,
+  })
+);
+
+// Signatures with HTML patterns, so the body pass skips header-only technologies
+const HTML_SIGNATURES: readonly CompiledSignature[] = COMPILED_SIGNATURES.filter(
+  (sig) => sig.htmlPattern !== null
+);
+
+// Signatures grouped by the header names they inspect
+const HEADER_SIGNATURES = new Map<string, CompiledSignature[]>();
+for (const sig of COMPILED_SIGNATURES) {
+  for (const h of sig.headers) {
+    const group = HEADER_SIGNATURES.get(h);
+    if (group) group.push(sig);
+    else HEADER_SIGNATURES.set(h, [sig]);
   }
+}
 
-  private _loadSignatures(): TechSignatures {
-    return {
-      // Web Servers
-      apache: {
-        headers: ['server'],
-        patterns: [/apache/i, /httpd/i],
-        category: 'web_server',
-      },
-      nginx: {
-        headers: ['server'],
-        patterns: [/nginx/i],
-        category: 'web_server',
-      },
-      iis: {
-        headers: ['server'],
-        patterns: [/microsoft-iis/i, /iis/i],
-        category: 'web_server',
-      },
-      cloudflare: {
-        headers: ['server', 'cf-ray'],
-        patterns: [/cloudflare/i],
-        category: 'cdn',
-      },
-
-      // Languages
-      php: {
-        headers: ['x-powered-by', 'server'],
-        patterns: [/php/i, /\.php/i],
-        htmlPatterns: [/\.php\?/i, /\.php$/i],
-        category: 'language',
-      },
-      'asp.net': {
-        headers: ['x-powered-by', 'x-aspnet-version'],
-        patterns: [/asp\.net/i, /aspnet/i],
-        htmlPatterns: [/\.aspx/i, /__viewstate/i],
-        category: 'language',
-      },
-
-      // Frameworks
-      django: {
-        headers: ['server'],
-        patterns: [/django/i],
-        htmlPatterns: [/csrfmiddlewaretoken/i],
-        category: 'framework',
-      },
-      flask: {
-        headers: ['server'],
-        patterns: [/flask/i],
-        category: 'framework',
-      },
-      rails: {
-        headers: ['x-powered-by'],
-        patterns: [/ruby/i, /rails/i],
-        htmlPatterns: [/authenticity_token/i],
-        category: 'framework',
-      },
-      express: {
-        headers: ['x-powered-by'],
-        patterns: [/express/i],
-        category: 'framework',
-      },
-
-      // CMS
-      wordpress: {
-        htmlPatterns: [/wp-content/i, /wp-includes/i, /wordpress/i, /wp-json/i, /\/wp-admin\//i],
-        category: 'cms',
-      },
-      drupal: {
-        htmlPatterns: [/drupal/i, /\/sites\/default\//i, /drupal\.js/i],
-        category: 'cms',
-      },
-      shopify: {
-        htmlPatterns: [/shopify/i, /cdn\.shopify\.com/i, /myshopify\.com/i],
-        category: 'cms',
-      },
-
-      // JS Libs
-      jquery: {
-        htmlPatterns: [/jquery/i, /jquery\.min\.js/i],
-        category: 'javascript',
-      },
-      react: {
-        htmlPatterns: [/react/i, /react\.js/i, /react\.min\.js/i, /data-reactroot/i],
-        category: 'javascript',
-      },
-      vue: {
-        htmlPatterns: [/vue\.js/i, /vue\.min\.js/i, /v-if/i, /v-for/i],
-        category: 'javascript',
-      },
-      angular: {
-        htmlPatterns: [/angular/i, /ng-app/i, /ng-controller/i],
-        category: 'javascript',
-      },
-      bootstrap: {
-        htmlPatterns: [/bootstrap/i, /bootstrap\.css/i, /bootstrap\.js/i, /col-/i, /container/i],
-        category: 'css_framework',
-      },
-
-      // Analytics
-      google_analytics: {
-        htmlPatterns: [/google-analytics/i, /gtag/i, /ga\(/i],
-        category: 'analytics',
-      },
-    };
+// Every header name some signature inspects
+const FINGERPRINT_HEADERS: readonly string[] = Array.from(HEADER_SIGNATURES.keys());
+
+// Signatures matched by a given header value. A crawl sees the same Server and
+// X-Powered-By values on page after page, so each distinct value is matched once.
+const headerVerdicts = new LRUCache<string, readonly CompiledSignature[]>(256);
+
+const matchHeader = (name: string, value: string): readonly CompiledSignature[] => {
+  const key = `${name}:${value}`;
+  let hits = headerVerdicts.get(key);
+  if (!hits) {
+    // Lowercase once; header patterns are compiled lowercase and case-sensitive
+    const lowered = value.toLowerCase();
+    hits = HEADER_SIGNATURES.get(name)!.filter(
+      (sig) => sig.headerPattern === null || sig.headerPattern.test(lowered)
+    );
+    headerVerdicts.set(key, hits);
+  }
+  return hits;
+};
+
+// Headers counted towards the security score (lowercase names)
+const SECURITY_HEADERS: readonly string[] = Object.freeze([
+  'strict-transport-security',
+  'content-security-policy',
+  'x-frame-options',
+  'x-content-type-options',
+  'x-xss-protection',
+  'referrer-policy',
+  'permissions-policy',
+  'feature-policy',
+  'expect-ct',
+  'public-key-pins',
+]);
+
+/**
+ * Header map keyed by lowercase name. Playwright already lowercases response header
+ * names, so the input is returned as-is unless some key actually needs folding.
+ */
+const lowercaseHeaderNames = (headers: Record<string, string>): Record<string, string> => {
+  const names = Object.keys(headers);
+  if (names.every((k) => k === k.toLowerCase())) return headers;
+
+  const normalized: Record<string, string> = {};
+  for (const k of names) {
+    normalized[k.toLowerCase()] = headers[k];
+  }
+  return normalized;
+};
+
+export class TechnologyFingerprinter {
+  private compiledSignatures: readonly CompiledSignature[];
+  private securityHeaders: readonly string[];
+
+  constructor() {
+    this.compiledSignatures = COMPILED_SIGNATURES;
+    this.securityHeaders = SECURITY_HEADERS;
   }
 
-  public analyze(
-    headers: Record<string, string>,
-    html: string
-  ): {
-    technologies: Technology[];
-    securityHeaders: Record<string, string>;
-    securityScore: number;
-  } {
+  public analyze(headers: Record<string, string>, html: string): FingerprintResult {
     const detected: Technology[] = [];
-    const normalizedHeaders: Record<string, string> = {};
-    for (const [k, v] of Object.entries(headers)) {
-      normalizedHeaders[k.toLowerCase()] = v;
-    }
+    const normalizedHeaders = lowercaseHeaderNames(headers);
+
+    // One hit flag per signature; a signature matched through several headers (or
+    // through headers and HTML) just sets its flag again
+    const hits = new Uint8Array(this.compiledSignatures.length);
 
-    // Check Signatures
-    for (const [techName, sig] of Object.entries(this.signatures)) {
-      let found = false;
-
-      // Check Headers
-      if (sig.headers) {
-        for (const h of sig.headers) {
-          if (normalizedHeaders[h]) {
-            const val = normalizedHeaders[h];
-            if (sig.patterns) {
-              for (const p of sig.patterns) {
-                if (p.test(val)) {
-                  this._addTech(detected, techName, sig.category);
-                  found = true;
-                  break;
-                }
-              }
-            } else {
-              // Existence check
-              this._addTech(detected, techName, sig.category);
-              found = true;
-            }
-          }
-          if (found) break;
-        }
+    // Check Headers (pattern match, or existence when the signature has no patterns)
+    for (const h of FINGERPRINT_HEADERS) {
+      const value = normalizedHeaders[h];
+      if (value) {
+        for (const sig of matchHeader(h, value)) hits[sig.index] = 1;
       }
-      if (found) continue;
-
-      // Check HTML
-      if (sig.htmlPatterns && html) {
-        for (const p of sig.htmlPatterns) {
-          if (p.test(html)) {
-            this._addTech(detected, techName, sig.category);
-            break;
-          }
-        }
+    }
+
+    // Check HTML, only for signatures that have HTML patterns and aren't already hit
+    if (html) {
+      for (const sig of HTML_SIGNATURES) {
+        if (hits[sig.index] === 0 && sig.htmlPattern!.test(html)) hits[sig.index] = 1;
       }
     }
 
+    // Report in table order, so results keep a stable order
+    for (const sig of this.compiledSignatures) {
+      if (hits[sig.index] === 1) detected.push(sig.technology);
+    }
+
     // Security Headers Analysis
     const foundSecHeaders: Record<string, string> = {};
     for (const h of this.securityHeaders) {
@@ -223,10 +330,4 @@ export class TechnologyFingerprinter {
       securityScore: Math.round(securityScore),
     };
   }
-
-  private _addTech(list: Technology[], name: string, category: Technology['category']) {
-    if (!list.find((t) => t.name === name)) {
-      list.push({ name, category, confidence: 'medium' });
-    }
-  }
 }
@@ -1,16 +1,15 @@
 import pino from 'pino';
-import { env } from 'process';
+import { env, isDevelopment } from './env';
 
 export const logger = pino({
-  level: env.LOG_LEVEL || 'info',
-  transport:
-    env.NODE_ENV === 'development'
-      ? {
-          target: 'pino-pretty',
-          options: {
-            translateTime: 'HH:MM:ss Z',
-            ignore: 'pid,hostname',
-          },
-        }
-      : undefined,
+  level: env.LOG_LEVEL,
+  transport: isDevelopment
+    ? {
+        target: 'pino-pretty',
+        options: {
+          translateTime: 'HH:MM:ss Z',
+          ignore: 'pid,hostname',
+        },
+      }
+    : undefined,
 });
@@ -0,0 +1,56 @@
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Small bounded LRU cache with optional per-entry TTL.
+ * Relies on Map preserving insertion order: a hit re-inserts the key so the
+ * first key is always the least recently used one and is evicted when full.
+ */
+export class LRUCache<K, V> {
+  private entries = new Map<K, CacheEntry<V>>();
+
+  constructor(
+    private readonly maxSize: number,
+    private readonly ttlMs: number = Infinity
+  ) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (this.ttlMs !== Infinity && Date.now() > entry.expiresAt) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Refresh recency
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    if (this.entries.has(key)) {
+      this.entries.delete(key);
+    } else if (this.entries.size >= this.maxSize) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) this.entries.delete(oldest.value);
+    }
+
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
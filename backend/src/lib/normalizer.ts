@@ -1,4 +1,5 @@
 import { URL } from 'url';
+import { LRUCache } from './lru-cache';
 
 /**
  * URL normalizer for consistent URL handling and deduplication.
@@ -7,6 +8,8 @@ import { URL } from 'url';
 export class URLNormalizer {
   private excludedExtensions: Set<string>;
   private trackingParams: Set<string>;
+  // isSameDomain re-parses the same page URL for every link on it; memoize hostnames
+  private domainCache = new LRUCache<string, string>(1024);
 
   constructor() {
     this.excludedExtensions = new Set([
@@ -158,11 +161,18 @@ export class URLNormalizer {
   }
 
   extractDomain(url: string): string {
+    const cached = this.domainCache.get(url);
+    if (cached !== undefined) return cached;
+
+    let domain: string;
     try {
-      return new URL(url).hostname;
+      domain = new URL(url).hostname;
     } catch {
-      return '';
+      domain = '';
     }
+
+    this.domainCache.set(url, domain);
+    return domain;
   }
 
   isSameDomain(url1: string, url2: string): boolean {
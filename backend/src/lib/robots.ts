@@ -1,15 +1,42 @@
 import robotsParser from 'robots-parser';
 import { URL } from 'url';
+import { LRUCache } from './lru-cache';
 
-interface RobotsCacheItem {
-  parser: any;
-  expiresAt: number;
+const TTL_MS = 15 * 60 * 1000; // 15 minutes
+const MAX_CACHE_SIZE = 256;
+// Like Google, only the first 500 KiB of a robots.txt is read; anything after is ignored
+const MAX_ROBOTS_BYTES = 500 * 1024;
+
+/**
+ * Read a response body as text, stopping after `maxBytes`. The body is streamed, so an
+ * oversized (or endless) robots.txt never gets buffered whole.
+ */
+async function readTextCapped(response: Response, maxBytes: number): Promise<string> {
+  if (!response.body) return '';
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let text = '';
+  let received = 0;
+
+  while (received < maxBytes) {
+    const { done, value } = await reader.read();
+    if (done) return text + decoder.decode();
+
+    const remaining = maxBytes - received;
+    const chunk = value.byteLength > remaining ? value.subarray(0, remaining) : value;
+    received += chunk.byteLength;
+    text += decoder.decode(chunk, { stream: true });
+  }
+
+  // Cap reached: drop the rest of the body and release the connection
+  await reader.cancel().catch(() => {});
+  return text + decoder.decode();
 }
 
 export class RobotsService {
-  private cache = new Map<string, RobotsCacheItem>();
-  private readonly TTL_MS = 15 * 60 * 1000; // 15 minutes
-  private readonly MAX_CACHE_SIZE = 256;
+  private cache = new LRUCache<string, any>(MAX_CACHE_SIZE, TTL_MS);
+  private inflight = new Map<string, Promise<any>>();
 
   constructor() {}
 
@@ -21,39 +48,8 @@ export class RobotsService {
     try {
       const parsedUrl = new URL(url);
       const origin = parsedUrl.origin;
-      const robotsUrl = `${origin}/robots.txt`;
-
-      let parser = this.getCachedParser(origin);
-
-      if (!parser) {
-        try {
-          // Fetch robots.txt
-          const response = await fetch(robotsUrl, {
-            method: 'GET',
-            headers: { 'User-Agent': userAgent },
-            signal: AbortSignal.timeout(5000), // 5s timeout
-          });
-
-          let content = '';
-          if (response.status === 200) {
-            content = await response.text();
-          } else {
-            // If 404 or other error, assume allowed (empty content)
-            content = '';
-          }
-
-          // Initialize parser
-          parser = robotsParser(robotsUrl, content);
-          this.setCachedParser(origin, parser);
-        } catch (err) {
-          console.warn(`Failed to fetch robots.txt for ${origin}:`, err);
-          // On fetch error, allow crawling essentially (or could be strict and disallow)
-          // Defaulting to Allow if robots.txt is unreachable is common, though polite crawlers might back off.
-          // We'll create a dummy parser that allows everything.
-          parser = robotsParser(robotsUrl, '');
-          this.setCachedParser(origin, parser);
-        }
-      }
+
+      const parser = this.getCachedParser(origin) ?? (await this.loadParser(origin, userAgent));
 
       return parser.isAllowed(url, userAgent) ?? true;
     } catch (e) {
@@ -62,27 +58,60 @@ export class RobotsService {
     }
   }
 
-  private getCachedParser(origin: string): any | null {
-    const item = this.cache.get(origin);
-    if (!item) return null;
-
-    if (Date.now() > item.expiresAt) {
-      this.cache.delete(origin);
-      return null;
+  /**
+   * Fetch and parse robots.txt for an origin.
+   * Concurrent callers for the same origin share a single in-flight request.
+   */
+  private loadParser(origin: string, userAgent: string): Promise<any> {
+    let pending = this.inflight.get(origin);
+    if (!pending) {
+      pending = this.fetchParser(origin, userAgent).finally(() => this.inflight.delete(origin));
+      this.inflight.set(origin, pending);
     }
-    return item.parser;
+    return pending;
   }
 
-  private setCachedParser(origin: string, parser: any) {
-    // Evict if full
-    if (this.cache.size >= this.MAX_CACHE_SIZE) {
-      const firstKey = this.cache.keys().next().value;
-      if (firstKey) this.cache.delete(firstKey);
+  private async fetchParser(origin: string, userAgent: string): Promise<any> {
+    const robotsUrl = `${origin}/robots.txt`;
+    let parser: any;
+
+    try {
+      // Fetch robots.txt
+      const response = await fetch(robotsUrl, {
+        method: 'GET',
+        headers: { 'User-Agent': userAgent },
+        signal: AbortSignal.timeout(5000), // 5s timeout
+      });
+
+      let content = '';
+      if (response.status === 200) {
+        content = await readTextCapped(response, MAX_ROBOTS_BYTES);
+      } else {
+        // If 404 or other error, assume allowed (empty content).
+        // Discard the error page body so the connection is released without buffering it.
+        await response.body?.cancel().catch(() => {});
+        content = '';
+      }
+
+      // Initialize parser
+      parser = robotsParser(robotsUrl, content);
+    } catch (err) {
+      console.warn(`Failed to fetch robots.txt for ${origin}:`, err);
+      // On fetch error, allow crawling essentially (or could be strict and disallow)
+      // Defaulting to Allow if robots.txt is unreachable is common, though polite crawlers might back off.
+      // We'll create a dummy parser that allows everything.
+      parser = robotsParser(robotsUrl, '');
     }
 
-    this.cache.set(origin, {
-      parser,
-      expiresAt: Date.now() + this.TTL_MS,
-    });
+    this.setCachedParser(origin, parser);
+    return parser;
+  }
+
+  private getCachedParser(origin: string): any | null {
+    return this.cache.get(origin) ?? null;
+  }
+
+  private setCachedParser(origin: string, parser: any) {
+    this.cache.set(origin, parser);
   }
 }
@@ -57,71 +57,95 @@ export class SchedulerService {
 
     logger.info({ count: dueScans.length }, `[Scheduler] Found due scans`);
 
-    for (const template of dueScans) {
-      await this.triggerRun(template);
-    }
+    await this.triggerRuns(dueScans);
   }
 
-  private async triggerRun(template: any) {
-    console.log(`[Scheduler] Triggering run for ${template.id} (${template.target_url})`);
-
-    // 1. Calculate next run
-    const cronExpression = template.schedule_cron;
-    let nextRun = null;
-    try {
-      // Use a library to parse cron and get next date?
-      // node-cron doesn't easily give "next date" from a string without a task.
-      // We might need `cron-parser`.
-      // For MVP, lets just add 24 hours if daily? No, we need proper cron handling.
-      // If we lack `cron-parser`, we can just rely on the user update or simple daily.
-      // Actually, we can install `cron-parser`.
-      // For now, let's just assume daily if cron is missing or complex.
-      // Or, we update the template's `next_run_at` to NULL to stop it,
-      // or ideally calculate next.
-      // Let's create the NEW scan first.
-    } catch (e) {
-      console.error('[Scheduler] Cron Parse Error', e);
+  private async triggerRuns(templates: any[]) {
+    for (const template of templates) {
+      logger.info(`[Scheduler] Triggering run for ${template.id} (${template.target_url})`);
     }
 
-    // 2. Create new Scan instance
-    const { data: newScan, error } = await supabase
-      .from('scans')
-      .insert({
-        project_id: template.project_id,
-        target_url: template.target_url,
-        status: 'pending',
-        type: template.type,
-        config: template.config,
-        parent_scan_id: template.id,
-        is_scheduled: false, // The child is NOT scheduled, it's a one-off run
-      })
-      .select()
-      .single();
-
-    if (error) {
-      console.error('[Scheduler] Failed to create child scan:', error);
-      return;
+    // 1. Calculate next run
+    // node-cron doesn't easily give "next date" from a string without a task and
+    // `cron-parser` isn't installed yet, so templates are re-armed +1 day (step 4).
+
+    // 2. Create the new Scan instances
+    const newScans = await this.createChildScans(templates);
+    if (newScans.length === 0) return;
+
+    // 3. Start Crawlers
+    for (const newScan of newScans) {
+      const crawler = new CrawlerService();
+      // Fire and forget, crawler manages its own state
+      crawler
+        .scan(newScan.id, newScan.project_id, newScan.target_url, newScan.config)
+        .catch((err) => {
+          logger.error({ err }, '[Scheduler] Crawler failed to start');
+        });
     }
 
-    // 3. Start Crawler
-    const crawler = new CrawlerService();
-    // Fire and forget, crawler manages its own state
-    crawler.scan(newScan.id, newScan.target_url, newScan.config).catch((e) => {
-      console.error('[Scheduler] Crawler failed to start:', e);
-    });
-
-    // 4. Update Template
+    // 4. Update Templates
     // Update last_run_at and next_run_at
     // Since we don't have cron-parser installed yet, let's default to +1 Day
+    // Only templates that got a child scan are re-armed; the rest are retried next tick.
+    // They all get the same timestamps, so re-arm them in one statement.
     const nextDate = new Date();
     nextDate.setDate(nextDate.getDate() + 1); // Default 24h
 
-    await supabase
+    const { error: updateError } = await supabase
       .from('scans')
       .update({
         last_run_at: new Date().toISOString(),
         next_run_at: nextDate.toISOString(), // Placeholder for real cron calc
       })
-      .eq('id', template.id);
+      .in('id', newScans.map((newScan) => newScan.parent_scan_id));
+
+    if (updateError) {
+      logger.error({ err: updateError }, '[Scheduler] Failed to update templates');
+    }
+  }
+
+  // Insert one child scan per template in a single round trip. If the batch is rejected,
+  // retry row by row so one bad template can't block the others.
+  private async createChildScans(templates: any[]): Promise<any[]> {
+    const rows = templates.map((template) => ({
+      project_id: template.project_id,
+      target_url: template.target_url,
+      status: 'pending',
+      type: template.type,
+      config: template.config,
+      parent_scan_id: template.id,
+      is_scheduled: false, // The child is NOT scheduled, it's a one-off run
+    }));
+
+    const { data: newScans, error } = await supabase.from('scans').insert(rows).select();
+    if (!error && newScans) return newScans;
+    if (rows.length === 1) {
+      logger.error(
+        { err: error, templateId: rows[0].parent_scan_id },
+        '[Scheduler] Failed to create child scan'
+      );
+      return [];
+    }
+
+    logger.warn({ err: error }, '[Scheduler] Bulk child scan insert failed, retrying per template');
+    const created: any[] = [];
+    for (const row of rows) {
+      const { data: newScan, error: rowError } = await supabase
+        .from('scans')
+        .insert(row)
+        .select()
+        .single();
+
+      if (rowError || !newScan) {
+        logger.error(
+          { err: rowError, templateId: row.parent_scan_id },
+          '[Scheduler] Failed to create child scan'
+        );
+        continue;
+      }
+      created.push(newScan);
+    }
+    return created;
   }
 }
@@ -1,18 +1,18 @@
 import * as Sentry from '@sentry/node';
-import { env } from 'process';
+import { env, isProduction } from './env';
 
 export const initSentry = () => {
-  if (process.env.SENTRY_DSN) {
+  if (env.SENTRY_DSN) {
     Sentry.init({
-      dsn: process.env.SENTRY_DSN,
-      environment: process.env.NODE_ENV || 'development',
-      tracesSampleRate: process.env.NODE_ENV === 'production' ? 0.1 : 1.0,
-      enabled: process.env.NODE_ENV === 'production',
+      dsn: env.SENTRY_DSN,
+      environment: env.NODE_ENV,
+      tracesSampleRate: isProduction ? 0.1 : 1.0,
+      enabled: isProduction,
     });
     console.log('✅ Sentry initialized');
   } else {
     // Silent in dev unless debugging
-    if (process.env.NODE_ENV === 'production') {
+    if (isProduction) {
       console.warn('⚠️ Sentry DSN not found, skipping initialization');
     }
   }
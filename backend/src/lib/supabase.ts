@@ -5,4 +5,29 @@ import { env } from './env';
  * Supabase client initialized with validated environment variables.
  * Uses the service role key for backend operations (bypasses RLS).
  */
-export const supabase = createClient(env.SUPABASE_URL, env.SUPABASE_SERVICE_ROLE_KEY);
+export const supabase = createClient(env.SUPABASE_URL, env.SUPABASE_SERVICE_ROLE_KEY, {
+  // Stateless server client: no session storage lookups or token refresh timers
+  auth: {
+    persistSession: false,
+    autoRefreshToken: false,
+  },
+});
+
+// Rows per INSERT statement; keeps large batches under PostgREST request size limits
+const INSERT_BATCH_SIZE = 500;
+
+/**
+ * Insert many rows with one multi-row statement per chunk instead of one per row.
+ * Stops at and returns the first error.
+ */
+export async function insertInBatches(
+  table: string,
+  rows: object[],
+  batchSize: number = INSERT_BATCH_SIZE
+): Promise<{ error: { message: string } | null }> {
+  for (let i = 0; i < rows.length; i += batchSize) {
+    const { error } = await supabase.from(table).insert(rows.slice(i, i + batchSize));
+    if (error) return { error };
+  }
+  return { error: null };
+}
@@ -1,12 +1,9 @@
 import { FastifyInstance } from 'fastify';
-import crypto from 'crypto';
 
 export const registerRequestId = (fastify: FastifyInstance) => {
   fastify.addHook('onRequest', (request, reply, done) => {
-    // Use existing X-Request-ID if present (for tracing across services), or generate new one
-    request.id = (request.headers['x-request-id'] as string) || crypto.randomUUID();
-
-    // Add request ID to response headers
+    // request.id is already the caller's X-Request-ID or a fresh UUID (see genReqId in app.ts),
+    // so echo it rather than generating a second ID that would disagree with the request logs
     reply.header('x-request-id', request.id);
 
     done();
@@ -6,6 +6,7 @@ import { supabase } from '../lib/supabase';
 import { z } from 'zod';
 import { success } from '../lib/response';
 import { AppError, DatabaseError } from '../lib/errors';
+import { env } from '../lib/env';
 
 // Validation schemas
 const verifyCodeSchema = z.object({
@@ -18,13 +19,14 @@ const challengeSchema = z.object({
 });
 
 // Encryption helpers (using AES-256-GCM)
-const ENCRYPTION_KEY = process.env.MFA_ENCRYPTION_KEY || crypto.randomBytes(32).toString('hex');
+const ENCRYPTION_KEY = env.MFA_ENCRYPTION_KEY || crypto.randomBytes(32).toString('hex');
 const ALGORITHM = 'aes-256-gcm';
+// Decoded once: the key is fixed for the process lifetime
+const ENCRYPTION_KEY_BYTES = Buffer.from(ENCRYPTION_KEY.slice(0, 64), 'hex');
 
 function encrypt(text: string): string {
   const iv = crypto.randomBytes(16);
-  const key = Buffer.from(ENCRYPTION_KEY.slice(0, 64), 'hex');
-  const cipher = crypto.createCipheriv(ALGORITHM, key, iv);
+  const cipher = crypto.createCipheriv(ALGORITHM, ENCRYPTION_KEY_BYTES, iv);
   
   let encrypted = cipher.update(text, 'utf8', 'hex');
   encrypted += cipher.final('hex');
@@ -38,9 +40,8 @@ function decrypt(encryptedData: string): string {
   const [ivHex, authTagHex, encrypted] = encryptedData.split(':');
   const iv = Buffer.from(ivHex, 'hex');
   const authTag = Buffer.from(authTagHex, 'hex');
-  const key = Buffer.from(ENCRYPTION_KEY.slice(0, 64), 'hex');
   
-  const decipher = crypto.createDecipheriv(ALGORITHM, key, iv);
+  const decipher = crypto.createDecipheriv(ALGORITHM, ENCRYPTION_KEY_BYTES, iv);
   decipher.setAuthTag(authTag);
   
   let decrypted = decipher.update(encrypted, 'hex', 'utf8');
@@ -65,19 +66,16 @@ function generateBackupCodes(count: number = 8): string[] {
   return codes;
 }
 
-// Rate limiting check
-async function checkRateLimit(userId: string): Promise<{ isLocked: boolean; remainingTime?: number }> {
-  const { data } = await supabase
-    .from('user_mfa_settings')
-    .select('failed_attempts, locked_until')
-    .eq('user_id', userId)
-    .single();
+// Rate limiting check against an already-loaded settings row
+function checkRateLimit(
+  data: { locked_until?: string | null } | null
+): { isLocked: boolean; remainingTime?: number } {
+  if (!data?.locked_until) return { isLocked: false };
 
-  if (!data) return { isLocked: false };
-
-  if (data.locked_until && new Date(data.locked_until) > new Date()) {
-    const remainingTime = Math.ceil((new Date(data.locked_until).getTime() - Date.now()) / 1000);
-    return { isLocked: true, remainingTime };
+  // Parse the lock timestamp once and compare against a single clock reading
+  const remainingMs = Date.parse(data.locked_until) - Date.now();
+  if (remainingMs > 0) {
+    return { isLocked: true, remainingTime: Math.ceil(remainingMs / 1000) };
   }
 
   return { isLocked: false };
@@ -91,25 +89,13 @@ async function recordAttempt(userId: string, isSuccess: boolean): Promise<void>
       .update({ failed_attempts: 0, locked_until: null, last_failed_at: null })
       .eq('user_id', userId);
   } else {
-    const { data } = await supabase
-      .from('user_mfa_settings')
-      .select('failed_attempts')
-      .eq('user_id', userId)
-      .single();
-
-    const newAttempts = (data?.failed_attempts || 0) + 1;
-    const lockUntil = newAttempts >= 5 
-      ? new Date(Date.now() + 15 * 60 * 1000).toISOString() // 15 min lockout
-      : null;
-
-    await supabase
-      .from('user_mfa_settings')
-      .update({ 
-        failed_attempts: newAttempts, 
-        last_failed_at: new Date().toISOString(),
-        locked_until: lockUntil
-      })
-      .eq('user_id', userId);
+    // Incremented in the database so concurrent wrong codes can't overwrite each other's count
+    const { error } = await supabase.rpc('record_mfa_failure', {
+      user_id_param: userId,
+      max_attempts: 5,
+      lockout_seconds: 15 * 60, // 15 min lockout
+    });
+    if (error) throw new DatabaseError(error.message);
   }
 }
 
@@ -258,8 +244,17 @@ export async function mfaRoutes(fastify: FastifyInstance) {
     const userId = request.user!.id;
     const { code, type } = challengeSchema.parse(request.body);
 
+    // One read serves the lockout check and code verification
+    const { data: settings, error } = await supabase
+      .from('user_mfa_settings')
+      .select(
+        'totp_secret, backup_codes, backup_codes_used, mfa_enabled, locked_until'
+      )
+      .eq('user_id', userId)
+      .single();
+
     // Rate limiting check
-    const rateLimit = await checkRateLimit(userId);
+    const rateLimit = checkRateLimit(settings);
     if (rateLimit.isLocked) {
       throw new AppError(
         `Too many attempts. Try again in ${rateLimit.remainingTime} seconds.`,
@@ -268,12 +263,6 @@ export async function mfaRoutes(fastify: FastifyInstance) {
       );
     }
 
-    const { data: settings, error } = await supabase
-      .from('user_mfa_settings')
-      .select('totp_secret, backup_codes, mfa_enabled')
-      .eq('user_id', userId)
-      .single();
-
     // For TOTP and backup codes, MFA must be enabled
     // For email verification, we allow it even if MFA is not enabled (for login verification)
     if (type !== 'email' && (error || !settings?.mfa_enabled)) {
@@ -304,7 +293,7 @@ export async function mfaRoutes(fastify: FastifyInstance) {
           .from('user_mfa_settings')
           .update({ 
             backup_codes: backupCodes,
-            backup_codes_used: (settings as any).backup_codes_used + 1
+            backup_codes_used: (settings.backup_codes_used || 0) + 1
           })
           .eq('user_id', userId);
       }
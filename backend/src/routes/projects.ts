@@ -4,6 +4,11 @@ import { supabase } from '../lib/supabase';
 import { DatabaseError, ValidationError } from '../lib/errors';
 import { success } from '../lib/response';
 
+const createProjectSchema = z.object({
+  name: z.string().min(1),
+  description: z.string().optional(),
+});
+
 export async function projectRoutes(fastify: FastifyInstance) {
   fastify.post(
     '/projects',
@@ -39,13 +44,7 @@ export async function projectRoutes(fastify: FastifyInstance) {
       },
     },
     async (request, reply) => {
-      // Global handler catches ZodError
-      const createProjectSchema = z.object({
-        name: z.string().min(1),
-        description: z.string().optional(),
-      });
-
-      // Validate body (userId coming from token)
+      // Validate body (userId coming from token); global handler catches ZodError
       const { name, description } = createProjectSchema.parse(request.body);
       const userId = (request as any).user?.id;
 
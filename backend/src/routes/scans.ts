@@ -1,6 +1,7 @@
 import { FastifyInstance } from 'fastify';
 import { z } from 'zod';
 import { supabase } from '../lib/supabase';
+import { CrawlerService } from '../lib/crawler';
 import { DatabaseError, NotFoundError } from '../lib/errors';
 import { success } from '../lib/response';
 import { validateParams, idParamSchema } from '../lib/validators';
@@ -84,8 +85,7 @@ export async function scanRoutes(fastify: FastifyInstance) {
     },
     async (request, reply) => {
       // 1. Parse Input (Global handler catches ZodError)
-      const bodyString = JSON.stringify(request.body);
-      const { projectId, targetUrl, config } = startScanSchema.parse(JSON.parse(bodyString));
+      const { projectId, targetUrl, config } = startScanSchema.parse(request.body);
 
       request.log.info({ projectId, targetUrl }, `[API] Creating scan for ${targetUrl}`);
 
@@ -111,7 +111,6 @@ export async function scanRoutes(fastify: FastifyInstance) {
       request.log.info({ scanId: scan.id, targetUrl }, `[Scanner] Triggering scan`);
 
       try {
-        const { CrawlerService } = await import('../lib/crawler');
         const crawler = new CrawlerService();
 
         // Fire and forget
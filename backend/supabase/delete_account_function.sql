@@ -8,24 +8,24 @@ RETURNS BOOLEAN
 LANGUAGE plpgsql
 SECURITY DEFINER
 AS $$
+DECLARE
+    project_ids UUID[];
 BEGIN
+    -- Resolve the user's projects once instead of re-running the lookup per table
+    SELECT COALESCE(array_agg(id), '{}') INTO project_ids
+    FROM projects WHERE user_id = user_id_param;
+
     -- Delete findings for user's scans
-    DELETE FROM findings 
+    DELETE FROM findings
     WHERE scan_id IN (
-        SELECT s.id FROM scans s 
-        JOIN projects p ON s.project_id = p.id 
-        WHERE p.user_id = user_id_param
+        SELECT id FROM scans WHERE project_id = ANY(project_ids)
     );
     
     -- Delete assets for user's projects
-    DELETE FROM assets WHERE project_id IN (
-        SELECT id FROM projects WHERE user_id = user_id_param
-    );
+    DELETE FROM assets WHERE project_id = ANY(project_ids);
     
     -- Delete scans for user's projects
-    DELETE FROM scans WHERE project_id IN (
-        SELECT id FROM projects WHERE user_id = user_id_param
-    );
+    DELETE FROM scans WHERE project_id = ANY(project_ids);
     
     -- Delete user's projects
     DELETE FROM projects WHERE user_id = user_id_param;
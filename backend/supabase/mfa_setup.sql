@@ -99,3 +99,26 @@ BEGIN
     DELETE FROM email_otp_codes WHERE expires_at < now();
 END;
 $$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Record a failed MFA attempt atomically
+-- ============================================
+-- Increments in a single UPDATE so concurrent wrong codes each count,
+-- and sets the lockout from the incremented value.
+CREATE OR REPLACE FUNCTION record_mfa_failure(
+    user_id_param UUID,
+    max_attempts INTEGER,
+    lockout_seconds INTEGER
+)
+RETURNS INTEGER AS $$
+    UPDATE user_mfa_settings
+    SET failed_attempts = COALESCE(failed_attempts, 0) + 1,
+        last_failed_at = now(),
+        locked_until = CASE
+            WHEN COALESCE(failed_attempts, 0) + 1 >= max_attempts
+            THEN now() + make_interval(secs => lockout_seconds)
+            ELSE NULL
+        END
+    WHERE user_id = user_id_param
+    RETURNING failed_attempts;
+$$ LANGUAGE sql;
@@ -0,0 +1,31 @@
+import { parseOrigins } from '../src/app';
+
+/**
+ * CORS Origin Parsing Tests
+ */
+describe('parseOrigins', () => {
+  it.each([
+    [
+      'splits a comma-separated list',
+      'http://localhost:3000,https://example.com',
+      false,
+      ['http://localhost:3000', 'https://example.com'],
+    ],
+    [
+      'trims whitespace around entries',
+      ' https://a.example.com , https://b.example.com ',
+      false,
+      ['https://a.example.com', 'https://b.example.com'],
+    ],
+    [
+      'allows localhost in development when unset',
+      undefined,
+      true,
+      ['http://localhost:3000', 'http://127.0.0.1:3000'],
+    ],
+    ['denies cross-origin outside development when unset', undefined, false, false],
+    ['treats an empty value as unset', '', false, false],
+  ])('%s', (_case, raw, development, expected) => {
+    expect(parseOrigins(raw, development)).toEqual(expected);
+  });
+});
@@ -0,0 +1,41 @@
+// Mock Supabase client (the crawler module creates it on import)
+jest.mock('../src/lib/supabase', () => ({
+  supabase: { from: jest.fn() },
+  insertInBatches: jest.fn(),
+}));
+
+import { collectPageLinks } from '../src/lib/crawler';
+
+/**
+ * Crawler link collection Tests
+ * collectPageLinks runs inside the page; minimal element stand-ins expose what it reads.
+ */
+describe('collectPageLinks', () => {
+  const baseURI = 'https://example.com/docs/page';
+  const anchor = (href: string | null, extra: object = {}) =>
+    ({ getAttribute: () => href, baseURI, ...extra }) as unknown as Element;
+
+  it('keeps links from inline SVG anchors next to normal ones', () => {
+    // An SVG <a>'s href property is an SVGAnimatedString, not a string
+    const svgAnchor = anchor('/x', { href: { baseVal: '/x', animVal: '/x' } });
+    const htmlAnchor = anchor('https://example.com/y', { href: 'https://example.com/y' });
+
+    expect(collectPageLinks([svgAnchor, htmlAnchor])).toEqual([
+      'https://example.com/x',
+      'https://example.com/y',
+    ]);
+  });
+
+  it('resolves relative links, drops duplicates and non-http(s) schemes', () => {
+    expect(
+      collectPageLinks([
+        anchor('next'),
+        anchor('/docs/next'),
+        anchor('mailto:team@example.com'),
+        anchor('javascript:void(0)'),
+        anchor('http://[invalid'),
+        anchor(null),
+      ])
+    ).toEqual(['https://example.com/docs/next']);
+  });
+});
@@ -0,0 +1,103 @@
+import { parseEnv } from '../src/lib/env';
+
+const BASE_ENV = {
+  SUPABASE_URL: 'https://project.supabase.co',
+  SUPABASE_SERVICE_ROLE_KEY: 'service-role-key',
+};
+
+// Known-good production deployment; cases override single keys from here
+const PRODUCTION_ENV = {
+  ...BASE_ENV,
+  NODE_ENV: 'production',
+  PORT: '8080',
+  LOG_LEVEL: 'warn',
+  ALLOWED_ORIGINS: 'https://app.example.com,https://admin.example.com',
+  SENTRY_DSN: 'https://public@o0.ingest.sentry.io/0',
+};
+
+/**
+ * Environment Schema Tests
+ * Each case parses an explicit object, so process.env is never mutated.
+ */
+describe('parseEnv', () => {
+  it('applies defaults for a minimal valid config', () => {
+    const result = parseEnv(BASE_ENV);
+
+    expect(result.success).toBe(true);
+    expect(result.data).toMatchObject({
+      PORT: 3001,
+      NODE_ENV: 'development',
+      LOG_LEVEL: 'info',
+      RATE_LIMIT_MAX: 100,
+      RATE_LIMIT_WINDOW_MS: 60000,
+    });
+  });
+
+  it('coerces numeric variables', () => {
+    const result = parseEnv({ ...BASE_ENV, PORT: '8080', RATE_LIMIT_MAX: '5' });
+
+    expect(result.data?.PORT).toBe(8080);
+    expect(result.data?.RATE_LIMIT_MAX).toBe(5);
+  });
+
+  it('accepts a complete production config', () => {
+    const result = parseEnv(PRODUCTION_ENV);
+
+    expect(result.success).toBe(true);
+    expect(result.data).toMatchObject({ NODE_ENV: 'production', PORT: 8080, LOG_LEVEL: 'warn' });
+  });
+
+  it('keeps production settings when optional monitoring is omitted', () => {
+    const result = parseEnv({ ...PRODUCTION_ENV, SENTRY_DSN: undefined });
+
+    expect(result.success).toBe(true);
+    expect(result.data?.SENTRY_DSN).toBeUndefined();
+  });
+
+  // Each override must fail on exactly its own key, not on some unrelated field
+  it.each([
+    ['a missing SUPABASE_URL', { SUPABASE_URL: undefined }],
+    ['a malformed SUPABASE_URL', { SUPABASE_URL: 'not-a-url' }],
+    ['an empty service role key', { SUPABASE_SERVICE_ROLE_KEY: '' }],
+    ['an unknown NODE_ENV', { NODE_ENV: 'staging' }],
+    ['an unknown LOG_LEVEL', { LOG_LEVEL: 'verbose' }],
+    ['a non-numeric PORT', { PORT: 'http' }],
+    ['a malformed SENTRY_DSN', { SENTRY_DSN: 'not-a-url' }],
+    ['a short MFA_ENCRYPTION_KEY', { MFA_ENCRYPTION_KEY: 'abc123' }],
+    ['a non-hex MFA_ENCRYPTION_KEY', { MFA_ENCRYPTION_KEY: 'z'.repeat(64) }],
+  ])('rejects %s', (_case, overrides) => {
+    const result = parseEnv({ ...BASE_ENV, ...overrides });
+
+    expect(result.success).toBe(false);
+    expect(result.error?.issues.map((issue) => issue.path.join('.'))).toEqual(
+      Object.keys(overrides)
+    );
+  });
+
+  describe('with several invalid keys', () => {
+    // One failing parse, shared by the assertions below
+    const result = parseEnv({
+      ...PRODUCTION_ENV,
+      SUPABASE_URL: undefined,
+      NODE_ENV: 'staging',
+      PORT: 'http',
+    });
+    const issues = result.error?.issues ?? [];
+
+    it('fails validation', () => {
+      expect(result.success).toBe(false);
+    });
+
+    it('reports every invalid key, not just the first', () => {
+      expect(issues.map((issue) => issue.path.join('.')).sort()).toEqual([
+        'NODE_ENV',
+        'PORT',
+        'SUPABASE_URL',
+      ]);
+    });
+
+    it('gives each issue a message for the startup report', () => {
+      expect(issues.every((issue) => issue.message.length > 0)).toBe(true);
+    });
+  });
+});
@@ -0,0 +1,63 @@
+import { TechnologyFingerprinter } from '../src/lib/fingerprinter';
+
+/**
+ * TechnologyFingerprinter Tests
+ */
+describe('TechnologyFingerprinter', () => {
+  const fingerprinter = new TechnologyFingerprinter();
+  const names = (headers: Record<string, string>, html: string) =>
+    fingerprinter.analyze(headers, html).technologies.map((t) => t.name);
+
+  it.each([
+    ['apache from the Server header', { server: 'Apache/2.4.41 (Ubuntu)' }, '', 'apache'],
+    ['nginx regardless of header case', { Server: 'NGINX' }, '', 'nginx'],
+    ['cloudflare from the Server header', { server: 'cloudflare' }, '', 'cloudflare'],
+    ['express from X-Powered-By', { 'x-powered-by': 'Express' }, '', 'express'],
+    ['wordpress from asset paths', {}, '<link href="/wp-content/themes/x.css">', 'wordpress'],
+    ['php from a query link', {}, '<a href="/index.php?id=1">', 'php'],
+    ['php from a trailing extension', {}, '<a href="/index.php', 'php'],
+    ['react from a root attribute', {}, '<div data-reactroot></div>', 'react'],
+    ['shopify from its CDN host', {}, '<script src="https://cdn.shopify.com/s.js">', 'shopify'],
+    ['google analytics from gtag', {}, '<script>gtag("config")</script>', 'google_analytics'],
+  ])('detects %s', (_case, headers, html, expected) => {
+    expect(names(headers, html)).toContain(expected);
+  });
+
+  it('reports each technology once with its category', () => {
+    const { technologies } = fingerprinter.analyze(
+      { server: 'nginx' },
+      '<script src="/js/jquery.min.js"></script><script src="/jquery-ui.js"></script>'
+    );
+
+    expect(technologies.filter((t) => t.name === 'jquery')).toEqual([
+      { name: 'jquery', category: 'javascript', confidence: 'medium' },
+    ]);
+    expect(technologies.find((t) => t.name === 'nginx')?.category).toBe('web_server');
+  });
+
+  it('matches repeated header values regardless of case', () => {
+    expect(names({ server: 'Apache/2.4.41' }, '')).toEqual(['apache']);
+    expect(names({ server: 'Apache/2.4.41' }, '')).toEqual(['apache']);
+    expect(names({ server: 'APACHE/2.4.41' }, '')).toEqual(['apache']);
+  });
+
+  it('detects nothing on an empty response', () => {
+    expect(names({}, '')).toEqual([]);
+  });
+
+  it('scores the security headers that are present', () => {
+    const result = fingerprinter.analyze(
+      {
+        'Strict-Transport-Security': 'max-age=31536000',
+        'X-Frame-Options': 'DENY',
+      },
+      ''
+    );
+
+    expect(result.securityHeaders).toEqual({
+      'strict-transport-security': 'max-age=31536000',
+      'x-frame-options': 'DENY',
+    });
+    expect(result.securityScore).toBe(20);
+  });
+});
@@ -13,7 +13,7 @@ describe('Health Check', () => {
     }
   });
 
-  it('GET /health returns 200', async () => {
+  it('GET /health returns 200 without authentication', async () => {
     const response = await app.inject({
       method: 'GET',
       url: '/health',
@@ -24,7 +24,7 @@ describe('Health Check', () => {
     expect(['healthy', 'degraded']).toContain(payload.status);
   });
 
-  it('GET / returns 200', async () => {
+  it('GET / returns 200 without authentication', async () => {
     const response = await app.inject({
       method: 'GET',
       url: '/',
@@ -32,4 +32,21 @@ describe('Health Check', () => {
     expect(response.statusCode).toBe(200);
     expect(JSON.parse(response.payload)).toHaveProperty('status', 'healthy');
   });
+
+  it('echoes a caller-supplied x-request-id', async () => {
+    const response = await app.inject({
+      method: 'GET',
+      url: '/',
+      headers: { 'x-request-id': 'trace-123' },
+    });
+    expect(response.headers['x-request-id']).toBe('trace-123');
+  });
+
+  it('generates an x-request-id when none is supplied', async () => {
+    const response = await app.inject({
+      method: 'GET',
+      url: '/',
+    });
+    expect(response.headers['x-request-id']).toMatch(/^[0-9a-f-]{36}$/);
+  });
 });
@@ -0,0 +1,46 @@
+const mockInsert = jest.fn();
+
+jest.mock('@supabase/supabase-js', () => ({
+  createClient: () => ({
+    from: jest.fn(() => ({ insert: mockInsert })),
+  }),
+}));
+
+import { insertInBatches } from '../src/lib/supabase';
+
+/**
+ * insertInBatches Tests
+ */
+describe('insertInBatches', () => {
+  const rows = Array.from({ length: 5 }, (_, i) => ({ id: i }));
+
+  it('issues one insert per chunk', async () => {
+    mockInsert.mockResolvedValue({ error: null });
+
+    const result = await insertInBatches('scan_logs', rows, 2);
+
+    expect(result.error).toBeNull();
+    expect(mockInsert.mock.calls.map(([chunk]) => chunk)).toEqual([
+      [{ id: 0 }, { id: 1 }],
+      [{ id: 2 }, { id: 3 }],
+      [{ id: 4 }],
+    ]);
+  });
+
+  it('does nothing for an empty batch', async () => {
+    await insertInBatches('scan_logs', []);
+
+    expect(mockInsert).not.toHaveBeenCalled();
+  });
+
+  it('stops at the first failing chunk', async () => {
+    mockInsert
+      .mockResolvedValueOnce({ error: null })
+      .mockResolvedValueOnce({ error: { message: 'boom' } });
+
+    const result = await insertInBatches('scan_logs', rows, 2);
+
+    expect(result.error).toEqual({ message: 'boom' });
+    expect(mockInsert).toHaveBeenCalledTimes(2);
+  });
+});
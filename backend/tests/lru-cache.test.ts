@@ -0,0 +1,44 @@
+import { LRUCache } from '../src/lib/lru-cache';
+
+/**
+ * LRUCache Tests
+ */
+describe('LRUCache', () => {
+  it('never grows past its maximum size', () => {
+    const cache = new LRUCache<number, number>(3);
+    for (let i = 0; i < 10; i++) cache.set(i, i);
+
+    expect(cache.size).toBe(3);
+    expect(cache.get(6)).toBeUndefined();
+    expect(cache.get(9)).toBe(9);
+  });
+
+  it('evicts the least recently used entry', () => {
+    const cache = new LRUCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+
+    // Touch "a" so "b" becomes the eviction candidate
+    expect(cache.get('a')).toBe(1);
+    cache.set('c', 3);
+
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('c')).toBe(3);
+  });
+
+  it('expires entries after the TTL', () => {
+    const nowSpy = jest.spyOn(Date, 'now').mockReturnValue(1_000);
+    const cache = new LRUCache<string, string>(10, 500);
+    cache.set('key', 'value');
+
+    nowSpy.mockReturnValue(1_400);
+    expect(cache.get('key')).toBe('value');
+
+    nowSpy.mockReturnValue(1_600);
+    expect(cache.get('key')).toBeUndefined();
+    expect(cache.size).toBe(0);
+
+    nowSpy.mockRestore();
+  });
+});
@@ -1,25 +1,19 @@
 import { buildApp } from '../src/app';
 import { supabase } from '../src/lib/supabase';
+import { createMockChain, createMockResponse, mockUser } from './utils/test-helpers';
 
 // Mock Supabase client
 jest.mock('../src/lib/supabase', () => ({
   supabase: {
     from: jest.fn(),
+    rpc: jest.fn(),
   },
 }));
 
-// Mock Authentication Middleware
-jest.mock('../src/middleware/auth', () => ({
-  registerAuthPlugin: (fastify: any) => {
-    fastify.addHook('onRequest', async (request: any) => {
-      request.user = {
-        id: '369e7102-8a9d-4767-850d-8302f30e9227',
-        email: 'test@example.com',
-        role: 'authenticated',
-      };
-    });
-  },
-}));
+// Mock Authentication Middleware (injects the shared mockUser fixture)
+jest.mock('../src/middleware/auth', () =>
+  require('./utils/test-helpers').createMockAuthMiddleware()
+);
 
 /**
  * MFA Routes Tests
@@ -35,19 +29,11 @@ describe('MFA Routes', () => {
     if (app) await app.close();
   });
 
-  beforeEach(() => {
-    jest.clearAllMocks();
-  });
-
   describe('GET /mfa/status', () => {
     it('returns MFA status when MFA is not enabled', async () => {
-      const mockSingle = jest.fn().mockResolvedValue({
-        data: null,
-        error: { code: 'PGRST116' },
-      });
-      const mockEq = jest.fn().mockReturnValue({ single: mockSingle });
-      const mockSelect = jest.fn().mockReturnValue({ eq: mockEq });
-      (supabase.from as jest.Mock).mockReturnValue({ select: mockSelect });
+      (supabase.from as jest.Mock).mockReturnValue(
+        createMockChain(createMockResponse(null, { code: 'PGRST116' }))
+      );
 
       const response = await app.inject({
         method: 'GET',
@@ -60,46 +46,37 @@ describe('MFA Routes', () => {
     });
   });
 
-  describe('POST /mfa/verify', () => {
-    it('returns 400 for missing code', async () => {
-      const response = await app.inject({
-        method: 'POST',
-        url: '/mfa/verify',
-        payload: {},
-      });
-
-      expect(response.statusCode).toBe(400);
-    });
-
-    it('returns 400 for invalid code format', async () => {
-      const response = await app.inject({
-        method: 'POST',
-        url: '/mfa/verify',
-        payload: { code: 'abc' },
-      });
-
-      expect(response.statusCode).toBe(400);
-    });
-  });
-
   describe('POST /mfa/challenge', () => {
-    it('returns 400 for missing fields', async () => {
+    it('records a wrong code with the atomic failure counter', async () => {
+      (supabase.from as jest.Mock).mockReturnValue(createMockChain(createMockResponse(null)));
+      (supabase.rpc as jest.Mock).mockResolvedValue(createMockResponse(1));
+
       const response = await app.inject({
         method: 'POST',
         url: '/mfa/challenge',
-        payload: {},
+        payload: { code: '123456', type: 'email' },
       });
 
       expect(response.statusCode).toBe(400);
+      expect(supabase.rpc).toHaveBeenCalledWith('record_mfa_failure', {
+        user_id_param: mockUser.id,
+        max_attempts: 5,
+        lockout_seconds: 900,
+      });
     });
   });
 
-  describe('POST /mfa/disable', () => {
-    it('returns 400 for missing code', async () => {
+  describe('request validation', () => {
+    it.each([
+      ['/mfa/verify', 'missing code', {}],
+      ['/mfa/verify', 'invalid code format', { code: 'abc' }],
+      ['/mfa/challenge', 'missing fields', {}],
+      ['/mfa/disable', 'missing code', {}],
+    ])('POST %s returns 400 for %s', async (url, _case, payload) => {
       const response = await app.inject({
         method: 'POST',
-        url: '/mfa/disable',
-        payload: {},
+        url,
+        payload,
       });
 
       expect(response.statusCode).toBe(400);
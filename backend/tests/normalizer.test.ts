@@ -0,0 +1,35 @@
+import { URLNormalizer } from '../src/lib/normalizer';
+import { LRUCache } from '../src/lib/lru-cache';
+
+/**
+ * URLNormalizer Tests
+ */
+describe('URLNormalizer', () => {
+  const normalizer = new URLNormalizer();
+
+  it('normalizes host case, default ports, tracking params and fragments', () => {
+    expect(normalizer.normalizeUrl('HTTPS://Example.COM:443/path/?utm_source=x&b=2&a=1#top')).toBe(
+      'https://example.com/path?a=1&b=2'
+    );
+  });
+
+  it('extracts domains and compares them', () => {
+    expect(normalizer.extractDomain('https://example.com/a')).toBe('example.com');
+    expect(normalizer.extractDomain('not a url')).toBe('');
+    expect(normalizer.isSameDomain('https://example.com/a', 'https://example.com/b')).toBe(true);
+    expect(normalizer.isSameDomain('https://example.com/a', 'https://other.com/a')).toBe(false);
+  });
+
+  it('memoizes extracted domains with a bounded cache', () => {
+    const local = new URLNormalizer();
+    const cache: LRUCache<string, string> = (local as any).domainCache;
+
+    expect(local.extractDomain('https://example.com/page')).toBe('example.com');
+    expect(cache.get('https://example.com/page')).toBe('example.com');
+
+    for (let i = 0; i < 2000; i++) {
+      local.extractDomain(`https://host${i}.example.com/`);
+    }
+    expect(cache.size).toBeLessThanOrEqual(1024);
+  });
+});
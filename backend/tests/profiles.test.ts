@@ -1,5 +1,6 @@
 import { buildApp } from '../src/app';
 import { supabase } from '../src/lib/supabase';
+import { createMockChain, createMockResponse, mockProfile } from './utils/test-helpers';
 
 // Mock Supabase client
 jest.mock('../src/lib/supabase', () => ({
@@ -8,18 +9,10 @@ jest.mock('../src/lib/supabase', () => ({
   },
 }));
 
-// Mock Authentication Middleware
-jest.mock('../src/middleware/auth', () => ({
-  registerAuthPlugin: (fastify: any) => {
-    fastify.addHook('onRequest', async (request: any) => {
-      request.user = {
-        id: '369e7102-8a9d-4767-850d-8302f30e9227',
-        email: 'test@example.com',
-        role: 'authenticated',
-      };
-    });
-  },
-}));
+// Mock Authentication Middleware (injects the shared mockUser fixture)
+jest.mock('../src/middleware/auth', () =>
+  require('./utils/test-helpers').createMockAuthMiddleware()
+);
 
 /**
  * Profile Routes Tests
@@ -35,22 +28,13 @@ describe('Profile Routes', () => {
     if (app) await app.close();
   });
 
-  beforeEach(() => {
-    jest.clearAllMocks();
-  });
-
   describe('GET /profiles', () => {
     it('returns list of profiles', async () => {
       const mockProfiles = [
         { id: 'p1', name: 'Quick Scan' },
         { id: 'p2', name: 'Deep Scan' },
       ];
-      const mockOrder = jest.fn().mockResolvedValue({
-        data: mockProfiles,
-        error: null,
-      });
-      const mockSelect = jest.fn().mockReturnValue({ order: mockOrder });
-      (supabase.from as jest.Mock).mockReturnValue({ select: mockSelect });
+      (supabase.from as jest.Mock).mockReturnValue(createMockChain(createMockResponse(mockProfiles)));
 
       const response = await app.inject({
         method: 'GET',
@@ -66,21 +50,14 @@ describe('Profile Routes', () => {
 
   describe('POST /profiles', () => {
     it('creates a profile successfully', async () => {
-      const mockProfile = { id: 'p1', name: 'Test Profile', config: {} };
-      const mockSingle = jest.fn().mockResolvedValue({
-        data: mockProfile,
-        error: null,
-      });
-      const mockSelect = jest.fn().mockReturnValue({ single: mockSingle });
-      const mockInsert = jest.fn().mockReturnValue({ select: mockSelect });
-      (supabase.from as jest.Mock).mockReturnValue({ insert: mockInsert });
+      (supabase.from as jest.Mock).mockReturnValue(createMockChain(createMockResponse(mockProfile)));
 
       const response = await app.inject({
         method: 'POST',
         url: '/profiles',
         payload: {
-          name: 'Test Profile',
-          config: {},
+          name: mockProfile.name,
+          config: mockProfile.config,
         },
       });
 
@@ -88,44 +65,34 @@ describe('Profile Routes', () => {
       const body = JSON.parse(response.payload);
       expect(body.success).toBe(true);
     });
-
-    it('returns 400 for missing name', async () => {
-      const response = await app.inject({
-        method: 'POST',
-        url: '/profiles',
-        payload: {
-          config: {},
-        },
-      });
-
-      expect(response.statusCode).toBe(400);
-    });
   });
 
   describe('DELETE /profiles/:id', () => {
     it('deletes a profile successfully', async () => {
-      const mockEq = jest.fn().mockResolvedValue({
-        data: null,
-        error: null,
-      });
-      const mockDelete = jest.fn().mockReturnValue({ eq: mockEq });
-      (supabase.from as jest.Mock).mockReturnValue({ delete: mockDelete });
+      const chain = createMockChain(createMockResponse(null));
+      (supabase.from as jest.Mock).mockReturnValue(chain);
 
       const response = await app.inject({
         method: 'DELETE',
-        url: '/profiles/a1b2c3d4-5678-90ab-cdef-1234567890ab',
+        url: `/profiles/${mockProfile.id}`,
       });
 
       expect(response.statusCode).toBe(200);
+      expect(chain.delete).toHaveBeenCalled();
+      expect(chain.eq).toHaveBeenCalledWith('id', mockProfile.id);
     });
+  });
 
-    it('returns 400 for invalid UUID', async () => {
-      const response = await app.inject({
-        method: 'DELETE',
-        url: '/profiles/invalid-uuid',
-      });
+  describe('request validation', () => {
+    it.each([
+      ['POST', '/profiles', 'missing name', { config: {} }],
+      ['DELETE', '/profiles/invalid-uuid', 'invalid UUID', undefined],
+    ])('%s %s returns 400 for %s', async (method, url, _case, payload) => {
+      // Rejected by schema validation before any query runs
+      const response = await app.inject({ method, url, payload });
 
       expect(response.statusCode).toBe(400);
+      expect(supabase.from).not.toHaveBeenCalled();
     });
   });
 });
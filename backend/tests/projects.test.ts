@@ -1,5 +1,6 @@
 import { buildApp } from '../src/app';
 import { supabase } from '../src/lib/supabase';
+import { createMockChain, createMockResponse, mockUser } from './utils/test-helpers';
 
 // Mock Supabase client
 jest.mock('../src/lib/supabase', () => ({
@@ -8,19 +9,10 @@ jest.mock('../src/lib/supabase', () => ({
   },
 }));
 
-// Mock Authentication Middleware
-jest.mock('../src/middleware/auth', () => ({
-  registerAuthPlugin: (fastify: any) => {
-    fastify.addHook('onRequest', async (request: any) => {
-      // Inject mock user for every request in tests
-      request.user = {
-        id: '369e7102-8a9d-4767-850d-8302f30e9227',
-        email: 'test@example.com',
-        role: 'authenticated',
-      };
-    });
-  },
-}));
+// Mock Authentication Middleware (injects the shared mockUser fixture)
+jest.mock('../src/middleware/auth', () =>
+  require('./utils/test-helpers').createMockAuthMiddleware()
+);
 
 describe('Project Routes', () => {
   let app: any;
@@ -33,22 +25,11 @@ describe('Project Routes', () => {
     if (app) await app.close();
   });
 
-  beforeEach(() => {
-    jest.clearAllMocks();
-  });
-
   it('POST /projects creates a project successfully', async () => {
-    // Mock the chain: .from().insert().select().single()
-    const mockSingle = jest.fn().mockResolvedValue({
-      data: { id: 'p-1', name: 'Test Project', user_id: '369e7102-8a9d-4767-850d-8302f30e9227' },
-      error: null,
-    });
-    const mockSelect = jest.fn().mockReturnValue({ single: mockSingle });
-    const mockInsert = jest.fn().mockReturnValue({ select: mockSelect });
-
-    (supabase.from as jest.Mock).mockReturnValue({
-      insert: mockInsert,
-    });
+    const chain = createMockChain(
+      createMockResponse({ id: 'p-1', name: 'Test Project', user_id: mockUser.id })
+    );
+    (supabase.from as jest.Mock).mockReturnValue(chain);
 
     const response = await app.inject({
       method: 'POST',
@@ -64,6 +45,9 @@ describe('Project Routes', () => {
     const body = JSON.parse(response.payload);
     expect(body.success).toBe(true);
     expect(body.data.name).toBe('Test Project');
+    expect(chain.insert).toHaveBeenCalledWith(
+      expect.objectContaining({ name: 'Test Project', user_id: mockUser.id })
+    );
   });
 
   it('POST /projects returns 400 for invalid input', async () => {
@@ -83,18 +67,14 @@ describe('Project Routes', () => {
   });
 
   it('GET /projects lists user projects', async () => {
-    // Mock chain: .from().select().eq()
-    const mockEq = jest.fn().mockResolvedValue({
-      data: [
-        { id: 'p-1', name: 'Project A', user_id: '369e7102-8a9d-4767-850d-8302f30e9227' },
-        { id: 'p-2', name: 'Project B', user_id: '369e7102-8a9d-4767-850d-8302f30e9227' },
-      ],
-      error: null,
-    });
-    const mockSelect = jest.fn().mockReturnValue({ eq: mockEq });
-    (supabase.from as jest.Mock).mockReturnValue({
-      select: mockSelect,
-    });
+    (supabase.from as jest.Mock).mockReturnValue(
+      createMockChain(
+        createMockResponse([
+          { id: 'p-1', name: 'Project A', user_id: mockUser.id },
+          { id: 'p-2', name: 'Project B', user_id: mockUser.id },
+        ])
+      )
+    );
 
     const response = await app.inject({
       method: 'GET',
@@ -0,0 +1,93 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+import { RobotsService } from '../src/lib/robots';
+
+/**
+ * RobotsService Tests
+ * Served by a real in-process HTTP server so the actual fetch/parse path is exercised.
+ */
+describe('RobotsService', () => {
+  let server: http.Server;
+  let origin: string;
+  let robotsRequests = 0;
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      if (req.url === '/robots.txt') {
+        robotsRequests++;
+        res.writeHead(200, { 'Content-Type': 'text/plain' });
+        res.end('User-agent: *\nDisallow: /private');
+        return;
+      }
+      res.writeHead(404);
+      res.end();
+    });
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    origin = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  beforeEach(() => {
+    robotsRequests = 0;
+  });
+
+  it('applies robots.txt rules', async () => {
+    const robots = new RobotsService();
+
+    expect(await robots.isAllowed(`${origin}/public`)).toBe(true);
+    expect(await robots.isAllowed(`${origin}/private/page`)).toBe(false);
+  });
+
+  it('fetches robots.txt once for concurrent checks on the same origin', async () => {
+    const robots = new RobotsService();
+
+    const results = await Promise.all([
+      robots.isAllowed(`${origin}/a`),
+      robots.isAllowed(`${origin}/b`),
+      robots.isAllowed(`${origin}/private/c`),
+    ]);
+
+    expect(results).toEqual([true, true, false]);
+    expect(robotsRequests).toBe(1);
+
+    // Subsequent checks are served from the cache
+    await robots.isAllowed(`${origin}/d`);
+    expect(robotsRequests).toBe(1);
+  });
+
+  it('ignores rules past the first 500 KiB of robots.txt', async () => {
+    const padding = `# ${'x'.repeat(600 * 1024)}\n`;
+    const big = http.createServer((req, res) => {
+      res.writeHead(200, { 'Content-Type': 'text/plain' });
+      res.end(`User-agent: *\nDisallow: /early\n${padding}Disallow: /late\n`);
+    });
+    await new Promise<void>((resolve) => big.listen(0, '127.0.0.1', resolve));
+    const bigOrigin = `http://127.0.0.1:${(big.address() as AddressInfo).port}`;
+
+    try {
+      const robots = new RobotsService();
+      expect(await robots.isAllowed(`${bigOrigin}/early`)).toBe(false);
+      expect(await robots.isAllowed(`${bigOrigin}/late`)).toBe(true);
+    } finally {
+      await new Promise<void>((resolve) => big.close(() => resolve()));
+    }
+  });
+
+  it('allows crawling when robots.txt cannot be fetched', async () => {
+    const warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => {});
+    const robots = new RobotsService();
+
+    // Nothing listens on port 1, so the connection is refused
+    const results = await Promise.all([
+      robots.isAllowed('http://127.0.0.1:1/a'),
+      robots.isAllowed('http://127.0.0.1:1/b'),
+    ]);
+
+    expect(results).toEqual([true, true]);
+    expect(warnSpy).toHaveBeenCalledTimes(1);
+    warnSpy.mockRestore();
+  });
+});
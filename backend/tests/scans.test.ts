@@ -1,5 +1,13 @@
 import { buildApp } from '../src/app';
 import { supabase } from '../src/lib/supabase';
+import { CrawlerService } from '../src/lib/crawler';
+import {
+  createMockChain,
+  createMockError,
+  createMockResponse,
+  mockProject,
+  mockScan,
+} from './utils/test-helpers';
 
 // Mock Supabase client
 jest.mock('../src/lib/supabase', () => ({
@@ -8,19 +16,17 @@ jest.mock('../src/lib/supabase', () => ({
   },
 }));
 
-// Mock Authentication Middleware
-jest.mock('../src/middleware/auth', () => ({
-  registerAuthPlugin: (fastify: any) => {
-    fastify.addHook('onRequest', async (request: any) => {
-      request.user = {
-        id: '369e7102-8a9d-4767-850d-8302f30e9227',
-        email: 'test@example.com',
-        role: 'authenticated',
-      };
-    });
-  },
+// Mock the crawler so creating a scan never launches a real browser
+const mockCrawlerScan = jest.fn().mockResolvedValue(undefined);
+jest.mock('../src/lib/crawler', () => ({
+  CrawlerService: jest.fn().mockImplementation(() => ({ scan: mockCrawlerScan })),
 }));
 
+// Mock Authentication Middleware (injects the shared mockUser fixture)
+jest.mock('../src/middleware/auth', () =>
+  require('./utils/test-helpers').createMockAuthMiddleware()
+);
+
 /**
  * Scan Routes Tests
  */
@@ -35,60 +41,43 @@ describe('Scan Routes', () => {
     if (app) await app.close();
   });
 
-  beforeEach(() => {
-    jest.clearAllMocks();
-  });
-
   describe('POST /scans', () => {
     it('creates a scan successfully', async () => {
-      const mockScan = {
-        id: 'scan-123',
-        project_id: 'a1b2c3d4-5678-90ab-cdef-1234567890ab',
-        target_url: 'https://example.com',
-        status: 'queued',
-      };
-      const mockSingle = jest.fn().mockResolvedValue({
-        data: mockScan,
-        error: null,
-      });
-      const mockSelect = jest.fn().mockReturnValue({ single: mockSingle });
-      const mockInsert = jest.fn().mockReturnValue({ select: mockSelect });
-      (supabase.from as jest.Mock).mockReturnValue({ insert: mockInsert });
+      const chain = createMockChain(createMockResponse(mockScan));
+      (supabase.from as jest.Mock).mockReturnValue(chain);
 
       const response = await app.inject({
         method: 'POST',
         url: '/scans',
         payload: {
-          projectId: 'a1b2c3d4-5678-90ab-cdef-1234567890ab',
-          targetUrl: 'https://example.com',
+          projectId: mockScan.project_id,
+          targetUrl: mockScan.target_url,
         },
       });
 
       expect(response.statusCode).toBe(200);
       const body = JSON.parse(response.payload);
       expect(body.success).toBe(true);
+      expect(chain.insert).toHaveBeenCalledWith(
+        expect.objectContaining({ target_url: mockScan.target_url, status: 'queued' })
+      );
+      expect(CrawlerService).toHaveBeenCalledTimes(1);
+      expect(mockCrawlerScan).toHaveBeenCalledWith(
+        mockScan.id,
+        mockScan.project_id,
+        mockScan.target_url,
+        undefined
+      );
     });
 
-    it('returns 400 for missing projectId', async () => {
-      const response = await app.inject({
-        method: 'POST',
-        url: '/scans',
-        payload: {
-          targetUrl: 'https://example.com',
-        },
-      });
-
-      expect(response.statusCode).toBe(400);
-    });
-
-    it('returns 400 for invalid URL format', async () => {
+    it.each([
+      ['missing projectId', { targetUrl: 'https://example.com' }],
+      ['invalid URL format', { projectId: mockProject.id, targetUrl: 'not-a-valid-url' }],
+    ])('returns 400 for %s', async (_case, payload) => {
       const response = await app.inject({
         method: 'POST',
         url: '/scans',
-        payload: {
-          projectId: 'a1b2c3d4-5678-90ab-cdef-1234567890ab',
-          targetUrl: 'not-a-valid-url',
-        },
+        payload,
       });
 
       expect(response.statusCode).toBe(400);
@@ -96,26 +85,27 @@ describe('Scan Routes', () => {
   });
 
   describe('GET /scans/:id', () => {
-    it('returns scan details', async () => {
-      const mockScan = {
-        id: 'scan-123',
-        status: 'completed',
-        findings: [],
-      };
-      const mockSingle = jest.fn().mockResolvedValue({
-        data: mockScan,
-        error: null,
-      });
-      const mockEq = jest.fn().mockReturnValue({ single: mockSingle });
-      const mockSelect = jest.fn().mockReturnValue({ eq: mockEq });
-      (supabase.from as jest.Mock).mockReturnValue({ select: mockSelect });
+    it.each([
+      [
+        'returns scan details',
+        createMockResponse({ id: 'scan-123', status: 'completed', findings: [] }),
+        200,
+      ],
+      [
+        'returns 404 when the scan does not exist',
+        createMockError('No rows found', 'PGRST116'),
+        404,
+      ],
+    ])('%s', async (_case, result, expectedStatus) => {
+      (supabase.from as jest.Mock).mockReturnValue(createMockChain(result));
 
       const response = await app.inject({
         method: 'GET',
-        url: '/scans/a1b2c3d4-5678-90ab-cdef-1234567890ab',
+        url: `/scans/${mockScan.id}`,
       });
 
-      expect(response.statusCode).toBe(200);
+      expect(response.statusCode).toBe(expectedStatus);
+      expect(JSON.parse(response.payload).success).toBe(expectedStatus === 200);
     });
 
     it('returns 400 for invalid UUID format', async () => {
@@ -0,0 +1,76 @@
+import { supabase } from '../src/lib/supabase';
+import { SchedulerService } from '../src/lib/scheduler';
+import { createMockChain, createMockError, createMockResponse } from './utils/test-helpers';
+
+// Mock Supabase client
+jest.mock('../src/lib/supabase', () => ({
+  supabase: { from: jest.fn() },
+}));
+
+// Crawlers are fire-and-forget; only their start calls matter here
+const mockScan = jest.fn().mockResolvedValue(undefined);
+jest.mock('../src/lib/crawler', () => ({
+  CrawlerService: jest.fn().mockImplementation(() => ({ scan: mockScan })),
+}));
+
+/**
+ * Scheduler Tests
+ */
+describe('SchedulerService.triggerRuns', () => {
+  const template = (id: string) => ({
+    id,
+    project_id: 'project-1',
+    target_url: `https://${id}.example.com`,
+    type: 'quick',
+    config: {},
+  });
+  const child = (parentId: string) => ({
+    id: `child-${parentId}`,
+    project_id: 'project-1',
+    target_url: `https://${parentId}.example.com`,
+    config: {},
+    parent_scan_id: parentId,
+  });
+  const triggerRuns = (templates: any[]) =>
+    (new SchedulerService() as any).triggerRuns(templates);
+
+  it('creates all child scans in one insert and re-arms every template', async () => {
+    const insertChain = createMockChain(createMockResponse([child('t1'), child('t2')]));
+    const updateChain = createMockChain(createMockResponse(null));
+    (supabase.from as jest.Mock)
+      .mockReturnValueOnce(insertChain)
+      .mockReturnValueOnce(updateChain);
+
+    await triggerRuns([template('t1'), template('t2')]);
+
+    expect(insertChain.insert).toHaveBeenCalledTimes(1);
+    expect(mockScan).toHaveBeenCalledTimes(2);
+    expect(updateChain.in).toHaveBeenCalledWith('id', ['t1', 't2']);
+  });
+
+  it('falls back to per-template inserts and re-arms only the ones created', async () => {
+    const updateChain = createMockChain(createMockResponse(null));
+    (supabase.from as jest.Mock)
+      .mockReturnValueOnce(createMockChain(createMockError('invalid input')))
+      .mockReturnValueOnce(createMockChain(createMockError('invalid input')))
+      .mockReturnValueOnce(createMockChain(createMockResponse(child('t2'))))
+      .mockReturnValueOnce(updateChain);
+
+    await triggerRuns([template('t1'), template('t2')]);
+
+    expect(mockScan).toHaveBeenCalledTimes(1);
+    expect(mockScan).toHaveBeenCalledWith('child-t2', 'project-1', 'https://t2.example.com', {});
+    expect(updateChain.in).toHaveBeenCalledWith('id', ['t2']);
+  });
+
+  it('re-arms nothing when no child scan could be created', async () => {
+    (supabase.from as jest.Mock).mockReturnValueOnce(
+      createMockChain(createMockError('invalid input'))
+    );
+
+    await triggerRuns([template('t1')]);
+
+    expect(supabase.from).toHaveBeenCalledTimes(1);
+    expect(mockScan).not.toHaveBeenCalled();
+  });
+});
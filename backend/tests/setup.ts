@@ -10,3 +10,9 @@ import { webcrypto } from 'crypto';
 if (typeof global.crypto === 'undefined') {
   (global as any).crypto = webcrypto;
 }
+
+// Silence request/audit logging so failing-path tests don't pay for log serialization.
+// Set LOG_LEVEL explicitly to debug a suite.
+if (!process.env.LOG_LEVEL) {
+  process.env.LOG_LEVEL = 'silent';
+}
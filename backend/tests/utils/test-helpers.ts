@@ -3,35 +3,39 @@
  * Common mocks, helpers, and fixtures for backend tests
  */
 
+// Fixtures are frozen and shared by every suite; build a copy to vary one.
+// A single fixed timestamp keeps them deterministic across test files.
+const FIXTURE_TIMESTAMP = '2024-01-01T00:00:00.000Z';
+
 // Mock authenticated user
-export const mockUser = {
+export const mockUser = Object.freeze({
   id: '369e7102-8a9d-4767-850d-8302f30e9227',
   email: 'test@example.com',
   role: 'authenticated',
-};
+});
 
 // Mock project fixture
-export const mockProject = {
+export const mockProject = Object.freeze({
   id: 'a1b2c3d4-5678-90ab-cdef-1234567890ab',
   name: 'Test Project',
   user_id: mockUser.id,
   description: 'Test project description',
-  created_at: new Date().toISOString(),
-};
+  created_at: FIXTURE_TIMESTAMP,
+});
 
 // Mock scan fixture
-export const mockScan = {
+export const mockScan = Object.freeze({
   id: 'b2c3d4e5-6789-01ab-cdef-234567890abc',
   project_id: mockProject.id,
   target_url: 'https://example.com',
   status: 'queued',
   type: 'quick',
   config: {},
-  created_at: new Date().toISOString(),
-};
+  created_at: FIXTURE_TIMESTAMP,
+});
 
 // Mock scan with findings
-export const mockScanWithFindings = {
+export const mockScanWithFindings = Object.freeze({
   ...mockScan,
   status: 'completed',
   findings: [
@@ -44,16 +48,16 @@ export const mockScanWithFindings = {
     },
   ],
   assets: [{ count: 5 }],
-};
+});
 
 // Mock profile fixture
-export const mockProfile = {
+export const mockProfile = Object.freeze({
   id: 'c3d4e5f6-7890-12ab-cdef-345678901234',
   name: 'Quick Scan Profile',
   description: 'Fast scan with minimal checks',
   config: { maxDepth: 2, maxPages: 50 },
-  created_at: new Date().toISOString(),
-};
+  created_at: FIXTURE_TIMESTAMP,
+});
 
 // Helper to create mock Supabase response
 export const createMockResponse = <T>(data: T, error: any = null) => ({
@@ -67,20 +71,42 @@ export const createMockError = (message: string, code: string = 'DB_ERROR') => (
   error: { message, code },
 });
 
-// Mock Supabase chain helpers
+// Query-builder methods that return the builder itself in supabase-js
+const CHAIN_METHODS = [
+  'select',
+  'insert',
+  'update',
+  'upsert',
+  'delete',
+  'eq',
+  'neq',
+  'gt',
+  'in',
+  'is',
+  'match',
+  'order',
+  'limit',
+  'range',
+  'single',
+  'maybeSingle',
+];
+
+/**
+ * Lightweight fake of a Supabase query builder.
+ * Every method returns the same builder and the builder is awaitable, so any call
+ * sequence (`from().select().eq().single()`, `from().insert().select()`, ...)
+ * resolves to `finalResult` wherever the route awaits it.
+ */
 export const createMockChain = (finalResult: any) => {
-  const chain: any = {};
-  
-  // Add chainable methods
-  ['select', 'insert', 'update', 'delete', 'eq', 'single', 'order'].forEach(method => {
-    chain[method] = jest.fn().mockReturnValue(chain);
-  });
-  
-  // Make the last method in chain resolve
-  chain.single = jest.fn().mockResolvedValue(finalResult);
-  chain.order = jest.fn().mockResolvedValue(finalResult);
-  chain.eq = jest.fn().mockResolvedValue(finalResult);
-  
+  const chain: any = {
+    then: (resolve: (value: any) => unknown, reject?: (reason: any) => unknown) =>
+      Promise.resolve(finalResult).then(resolve, reject),
+  };
+
+  for (const method of CHAIN_METHODS) {
+    chain[method] = jest.fn(() => chain);
+  }
+
   return chain;
 };
 
@@ -1,4 +1,4 @@
-import { createClient } from '@/utils/supabase/server';
+import { getCurrentUser } from '@/utils/supabase/server';
 import { redirect } from 'next/navigation';
 import { SecurityScoreGauge } from '@/components/dashboard/security-score';
 import {
@@ -21,10 +21,7 @@ import {
 export const dynamic = 'force-dynamic'; // Ensure real-time data fetching
 
 export default async function DashboardPage() {
-  const supabase = createClient();
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const user = await getCurrentUser();
 
   if (!user) {
     return redirect('/login');
@@ -32,12 +29,14 @@ export default async function DashboardPage() {
 
   const displayName = user.user_metadata?.full_name || user.email?.split('@')[0] || 'Admin';
 
-  // Fetch Dashboard Data
-  const stats = await getDashboardStats();
+  // Fetch Dashboard Data (independent queries, run concurrently)
   // const networkData = await getNetworkMetrics() // Replaced by Graph
-  const graphData = await getGraphData();
-  const activityLogs = await getRecentActivity();
-  const projects = await getDashboardProjects();
+  const [stats, graphData, activityLogs, projects] = await Promise.all([
+    getDashboardStats(),
+    getGraphData(),
+    getRecentActivity(),
+    getDashboardProjects(),
+  ]);
 
   return (
     <div className="space-y-8 animate-in fade-in duration-500">
@@ -16,6 +16,7 @@ import {
   DialogTrigger,
 } from '@/components/ui/dialog';
 import { ScrollArea } from '@/components/ui/scroll-area';
+import { downloadJSON } from '@/utils/export-utils';
 
 interface ScanLog {
   id: number;
@@ -259,15 +260,7 @@ export default function ScanDetailsPage({ params }: { params: { id: string } })
                 logs: logs,
                 generated_at: new Date().toISOString(),
               };
-              const blob = new Blob([JSON.stringify(reportData, null, 2)], {
-                type: 'application/json',
-              });
-              const url = URL.createObjectURL(blob);
-              const a = document.createElement('a');
-              a.href = url;
-              a.download = `scan-report-${scan.id.slice(0, 8)}.json`;
-              a.click();
-              URL.revokeObjectURL(url);
+              downloadJSON(reportData, `scan-report-${scan.id.slice(0, 8)}.json`);
             }}
           >
             <CheckCircle2 className="h-4 w-4" /> Download Report
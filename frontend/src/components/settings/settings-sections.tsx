@@ -19,6 +19,7 @@ import { Label } from '@/components/ui/label';
 import { Button } from '@/components/ui/button';
 import { Switch } from '@/components/ui/switch';
 import { logger } from '@/utils/logger';
+import { downloadJSON } from '@/utils/export-utils';
 
 export function ProfileSection() {
   const [displayName, setDisplayName] = React.useState('');
@@ -272,13 +273,8 @@ export function ProfileSection() {
               if (!userId) return;
               const { exportUserData } = await import('@/lib/profile-api');
               const data = await exportUserData(userId);
-              const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
-              const url = URL.createObjectURL(blob);
-              const a = document.createElement('a');
-              a.href = url;
-              a.download = `vulnscanner-export-${new Date().toISOString().split('T')[0]}.json`;
-              a.click();
-              URL.revokeObjectURL(url);
+              const date = new Date().toISOString().split('T')[0];
+              downloadJSON(data, `vulnscanner-export-${date}.json`);
             }}
           >
             <Copy className="h-4 w-4 mr-2" /> Export
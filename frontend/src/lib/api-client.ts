@@ -153,7 +153,8 @@ export async function getScanStats() {
   const now = new Date();
   const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1).toISOString();
 
-  const [{ count: monthTotal }, { count: completed }] = await Promise.all([
+  // The three queries are independent, so issue them together
+  const [{ count: monthTotal }, { count: completed }, { data: durationData }] = await Promise.all([
     // Filter by current month
     supabase
       .from('scans')
@@ -164,17 +165,18 @@ export async function getScanStats() {
       .select('*', { count: 'exact', head: true })
       .eq('status', 'completed')
       .gte('created_at', startOfMonth),
+    // Sample for Average Duration
+    supabase
+      .from('scans')
+      .select('created_at, completed_at')
+      .eq('status', 'completed')
+      .not('completed_at', 'is', null)
+      .limit(50),
   ]);
 
   const successRate = monthTotal ? Math.round(((completed || 0) / monthTotal) * 100) : 100;
 
   // Calculate Average Duration
-  const { data: durationData } = await supabase
-    .from('scans')
-    .select('created_at, completed_at')
-    .eq('status', 'completed')
-    .not('completed_at', 'is', null)
-    .limit(50);
 
   let avgDuration = 'N/A';
   if (durationData && durationData.length > 0) {
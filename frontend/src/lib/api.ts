@@ -1,4 +1,5 @@
-import { createClient } from '@/utils/supabase/server';
+import { cache } from 'react';
+import { getServerClient } from '@/utils/supabase/server';
 import { logger } from '@/utils/logger';
 import { formatDistanceToNow } from 'date-fns';
 
@@ -70,11 +71,19 @@ export interface GraphData {
 
 // -- Fetchers --
 
+/**
+ * Current user's projects (RLS enforces ownership), memoized per server request.
+ * Several dashboard loaders start from this list; they share one query.
+ */
+const getUserProjects = cache(async () => {
+  return getServerClient().from('projects').select('id, name');
+});
+
 export async function getDashboardStats() {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // 1. First, get the current user's project IDs
-  const { data: userProjects, error: projectError } = await supabase.from('projects').select('id');
+  const { data: userProjects, error: projectError } = await getUserProjects();
 
   if (projectError) {
     logger.error('Error fetching projects:', { error: projectError });
@@ -168,7 +177,7 @@ export async function getDashboardStats() {
 }
 
 export async function getNetworkMetrics() {
-  const supabase = createClient();
+  const supabase = getServerClient();
   // Fetch last 24 points (e.g., hourly) - simplifying to just latest 20 rows for chart
   const { data } = await supabase
     .from('system_metrics')
@@ -186,7 +195,7 @@ export async function getNetworkMetrics() {
 }
 
 export async function getRecentActivity() {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Try activity_logs first
   const { data: activityLogs } = await supabase
@@ -261,7 +270,7 @@ export async function getRecentActivity() {
 }
 
 export async function getDashboardProjects() {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Fetch projects with their LATEST scan status
   // This is a bit complex in Supabase simple query, so we might multiple query or join.
@@ -276,10 +285,10 @@ export async function getDashboardProjects() {
 }
 
 export async function getGraphData(): Promise<GraphData> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // 1. Fetch User's Projects (RLS enforces ownership)
-  const { data: projects } = await supabase.from('projects').select('id, name');
+  const { data: projects } = await getUserProjects();
   if (!projects || projects.length === 0) return { nodes: [], links: [] };
 
   const projectIds = projects.map((p) => p.id);
@@ -378,25 +387,19 @@ export interface ProjectTableRow {
 }
 
 export async function getProjectsTableData(): Promise<ProjectTableRow[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
-  // 1. Fetch Projects
+  // Projects with their scans embedded (latest first) in a single round-trip
   const { data: projects } = await supabase
     .from('projects')
-    .select('*')
-    .order('created_at', { ascending: false });
+    .select('*, scans(score, status, completed_at, findings_count)')
+    .order('created_at', { ascending: false })
+    .order('completed_at', { referencedTable: 'scans', ascending: false });
   if (!projects) return [];
 
-  // 2. Fetch Latest Stats for each project
-  // Ideally this is a join, but for MVP we fetch all latest scans
-  const { data: latestScans } = await supabase
-    .from('scans')
-    .select('project_id, score, status, completed_at, findings_count')
-    .order('completed_at', { ascending: false });
-
   // Process
   return projects.map((p) => {
-    const pScans = latestScans?.filter((s) => s.project_id === p.id) || [];
+    const pScans: any[] = p.scans || [];
     const latestScan = pScans[0];
 
     // Real Trend
@@ -436,7 +439,7 @@ export interface GlobalVuln {
 }
 
 export async function getGlobalVulnerabilities(): Promise<GlobalVuln[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Fetch latest 10 open vulnerabilities across ALL projects
   const { data: vulns, error } = await supabase
@@ -476,7 +479,7 @@ export interface TeamMember {
 }
 
 export async function getTeamStats(): Promise<TeamMember[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Fetch profiles ordered by last seen
   const { data: profiles, error } = await supabase
@@ -512,7 +515,7 @@ export interface AssetStat {
 }
 
 export async function getAssetDistribution(): Promise<AssetStat[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Aggregate assets by type
   // Note: In a real production app, use a .rpc() call for aggregation to avoid fetching all rows
@@ -563,10 +566,10 @@ export interface ReportProjectSummary {
 }
 
 export async function getReportsGlobalStats(): Promise<ReportsGlobalStats> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // Get user's projects (RLS enforces ownership)
-  const { data: projects } = await supabase.from('projects').select('id');
+  const { data: projects } = await getUserProjects();
   const projectIds = projects?.map((p) => p.id) || [];
 
   if (projectIds.length === 0) {
@@ -621,7 +624,7 @@ export async function getReportsGlobalStats(): Promise<ReportsGlobalStats> {
 }
 
 export async function getReportsProjects(): Promise<ReportProjectSummary[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   const { data, error } = await supabase.rpc('get_project_scan_summaries');
 
   if (error) {
@@ -654,7 +657,7 @@ export interface ReportDetails {
 }
 
 export async function getReportDetails(scanId: string): Promise<ReportDetails | null> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   console.log(`[getReportDetails] Fetching report via RPC for ID: ${scanId}`);
 
   const { data, error } = await supabase.rpc('get_scan_report', { scan_uuid: scanId });
@@ -704,7 +707,7 @@ export interface ReportScanSummary {
 }
 
 export async function getReportsScans(): Promise<ReportScanSummary[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   console.log('[getReportsScans] Fetching recent scans via RPC...');
 
   const { data, error } = await supabase.rpc('get_recent_scans', { limit_count: 20 });
@@ -752,7 +755,7 @@ export interface FindingDetails {
 
 
 export async function getFindingDetails(findingId: string): Promise<FindingDetails | null> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   console.log(`[getFindingDetails] Fetching finding via RPC: ${findingId}`);
 
   const { data, error } = await supabase.rpc('get_finding_details', { finding_uuid: findingId });
@@ -766,7 +769,7 @@ export async function getFindingDetails(findingId: string): Promise<FindingDetai
 }
 
 export async function getRelatedFindings(scanId: string, title: string, severity: string): Promise<FindingDetails[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   const { data, error } = await supabase
     .from('findings')
     .select('*')
@@ -790,7 +793,7 @@ export interface ProjectTrend {
 }
 
 export async function getProjectRecentScans(projectId: string) {
-  const supabase = createClient();
+  const supabase = getServerClient();
   // Fetch last 5 scans
   const { data: scans } = await supabase
     .from('scans')
@@ -807,7 +810,7 @@ export async function getProjectRecentScans(projectId: string) {
 }
 
 export async function getProjectTrend(projectId: string): Promise<ProjectTrend[]> {
-  const supabase = createClient();
+  const supabase = getServerClient();
   // Fetch last 30 scans for this project
   const { data: scans } = await supabase
     .from('scans')
@@ -828,15 +831,9 @@ export async function getProjectTrend(projectId: string): Promise<ProjectTrend[]
 }
 
 export async function getProjectVulnerabilities(projectId: string): Promise<Vulnerability[]> {
-  const supabase = createClient();
-
-  // 1. Get scan IDs
-  const { data: scans } = await supabase.from('scans').select('id').eq('project_id', projectId);
-  const scanIds = scans?.map((s) => s.id) || [];
-
-  if (scanIds.length === 0) return [];
+  const supabase = getServerClient();
 
-  // 2. Get Vulns
+  // Vulnerabilities carry their project_id, so filter on it directly (no scan ID lookup)
   const { data, error } = await supabase
     .from('vulnerabilities')
     .select(
@@ -844,7 +841,7 @@ export async function getProjectVulnerabilities(projectId: string): Promise<Vuln
             id, title, severity, status, created_at, scan_id
         `
     )
-    .in('scan_id', scanIds)
+    .eq('project_id', projectId)
     .eq('status', 'open')
     .order('created_at', { ascending: false });
 
@@ -865,52 +862,44 @@ export async function getProjectVulnerabilities(projectId: string): Promise<Vuln
 }
 
 export async function getProjectDetails(projectId: string) {
-  const supabase = createClient();
-  const { data: project } = await supabase
-    .from('projects')
-    .select('*')
-    .eq('id', projectId)
-    .single();
+  const supabase = getServerClient();
+
+  // Project with only its latest scan embedded, and its open vulns keyed by project_id,
+  // fetched concurrently since neither depends on the other
+  const [{ data: project }, { data: vulns }] = await Promise.all([
+    supabase
+      .from('projects')
+      .select('*, scans(created_at, status, score)')
+      .eq('id', projectId)
+      .order('created_at', { referencedTable: 'scans', ascending: false })
+      .limit(1, { referencedTable: 'scans' })
+      .single(),
+    supabase
+      .from('vulnerabilities')
+      .select('severity')
+      .eq('project_id', projectId)
+      .eq('status', 'open'),
+  ]);
 
   if (!project) return null;
 
-  // Get latest scan
-  const { data: latestScan } = await supabase
-    .from('scans')
-    .select('*')
-    .eq('project_id', projectId)
-    .order('created_at', { ascending: false })
-    .limit(1)
-    .single();
-
-  // Get vulnerability counts
-  // 1. Get all scan IDs for this project
-  const { data: scans } = await supabase.from('scans').select('id').eq('project_id', projectId);
-  const scanIds = scans?.map((s) => s.id) || [];
+  const { scans, ...projectFields } = project;
+  const latestScan = scans?.[0];
 
   let openIssues = { critical: 0, high: 0, medium: 0, low: 0, info: 0, total: 0 };
 
-  if (scanIds.length > 0) {
-    // 2. Aggregate open vulns
-    const { data: vulns } = await supabase
-      .from('vulnerabilities')
-      .select('severity')
-      .in('scan_id', scanIds)
-      .eq('status', 'open');
-
-    if (vulns) {
-      vulns.forEach((v: any) => {
-        const sev = v.severity?.toLowerCase() as keyof typeof openIssues;
-        if (openIssues[sev] !== undefined) {
-          openIssues[sev]++;
-        }
-        openIssues.total++;
-      });
-    }
+  if (vulns) {
+    vulns.forEach((v: any) => {
+      const sev = v.severity?.toLowerCase() as keyof typeof openIssues;
+      if (openIssues[sev] !== undefined) {
+        openIssues[sev]++;
+      }
+      openIssues.total++;
+    });
   }
 
   return {
-    ...project,
+    ...projectFields,
     lastScan: latestScan?.created_at,
     lastScanStatus: latestScan?.status,
     securityScore: latestScan?.score ?? null,
@@ -931,7 +920,7 @@ export interface ProjectsPageStats {
 }
 
 export async function getProjectsPageStats(): Promise<ProjectsPageStats> {
-  const supabase = createClient();
+  const supabase = getServerClient();
 
   // 1. Get user's projects (RLS enforces ownership)
   const { data: projects, count: projectCount } = await supabase
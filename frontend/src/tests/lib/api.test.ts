@@ -4,25 +4,29 @@
  */
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 
-// Mock fetch globally
+// Mock fetch globally (stubbed per test and restored after, so it can't leak into other files)
 const mockFetch = vi.fn();
-global.fetch = mockFetch;
+
+// Minimal fetch Response stand-in: only the fields these tests read
+const jsonResponse = (body: unknown, status = 200) => ({
+  ok: status >= 200 && status < 300,
+  status,
+  json: async () => body,
+});
 
 describe('API Client', () => {
   beforeEach(() => {
     mockFetch.mockReset();
+    vi.stubGlobal('fetch', mockFetch);
   });
 
   afterEach(() => {
-    vi.clearAllMocks();
+    vi.unstubAllGlobals();
   });
 
   describe('fetch wrapper', () => {
     it('makes GET request with correct headers', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: async () => ({ data: [] }),
-      });
+      mockFetch.mockResolvedValueOnce(jsonResponse({ data: [] }));
 
       const response = await fetch('/api/projects', {
         method: 'GET',
@@ -42,10 +46,9 @@ describe('API Client', () => {
 
     it('makes POST request with body', async () => {
       const newProject = { name: 'Test Project' };
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: async () => ({ success: true, data: { id: '1', ...newProject } }),
-      });
+      mockFetch.mockResolvedValueOnce(
+        jsonResponse({ success: true, data: { id: '1', ...newProject } })
+      );
 
       const response = await fetch('/api/projects', {
         method: 'POST',
@@ -74,11 +77,7 @@ describe('API Client', () => {
     });
 
     it('handles 401 unauthorized', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 401,
-        json: async () => ({ error: 'Unauthorized' }),
-      });
+      mockFetch.mockResolvedValueOnce(jsonResponse({ error: 'Unauthorized' }, 401));
 
       const response = await fetch('/api/projects');
       expect(response.ok).toBe(false);
@@ -86,11 +85,7 @@ describe('API Client', () => {
     });
 
     it('handles 500 server error', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: false,
-        status: 500,
-        json: async () => ({ error: 'Internal Server Error' }),
-      });
+      mockFetch.mockResolvedValueOnce(jsonResponse({ error: 'Internal Server Error' }, 500));
 
       const response = await fetch('/api/projects');
       expect(response.ok).toBe(false);
@@ -101,10 +96,7 @@ describe('API Client', () => {
   describe('Response parsing', () => {
     it('parses JSON response correctly', async () => {
       const mockData = { success: true, data: [{ id: '1', name: 'Project 1' }] };
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: async () => mockData,
-      });
+      mockFetch.mockResolvedValueOnce(jsonResponse(mockData));
 
       const response = await fetch('/api/projects');
       const data = await response.json();
@@ -115,10 +107,7 @@ describe('API Client', () => {
     });
 
     it('handles empty response', async () => {
-      mockFetch.mockResolvedValueOnce({
-        ok: true,
-        json: async () => ({ success: true, data: [] }),
-      });
+      mockFetch.mockResolvedValueOnce(jsonResponse({ success: true, data: [] }));
 
       const response = await fetch('/api/projects');
       const data = await response.json();
@@ -0,0 +1,50 @@
+/**
+ * Export Utilities Tests
+ * Tests for CSV report generation
+ */
+import { describe, it, expect } from 'vitest';
+import { generateCSV, ReportData } from '@/utils/export-utils';
+
+const baseReport: ReportData = {
+  id: 'scan-1',
+  target_url: 'https://example.com',
+  project_name: 'Acme, Inc.',
+  created_at: '2024-01-01T00:00:00Z',
+  severity_distribution: { critical: 1, high: 0, medium: 0, low: 0, info: 0 },
+  findings: [
+    {
+      id: 'f-1',
+      title: 'Reflected "XSS"',
+      severity: 'critical',
+      status: 'open',
+      description: 'Line one\nLine two',
+      remediation: 'Encode output',
+    },
+  ],
+};
+
+describe('generateCSV', () => {
+  it('writes the summary and one row per finding', () => {
+    const lines = generateCSV(baseReport).split('\n');
+
+    expect(lines[0]).toBe('Scan Report Summary');
+    expect(lines).toContain('Target URL,https://example.com');
+    expect(lines).toContain('Total Findings,1');
+    expect(lines).toContain('Critical,1');
+    expect(lines).toContain('ID,Title,Severity,Status,Category,CVE ID,CVSS Score,Description,Remediation');
+    expect(lines[lines.length - 1]).toBe(
+      'f-1,"Reflected ""XSS""",critical,open,N/A,N/A,N/A,Line one Line two,Encode output'
+    );
+  });
+
+  it('quotes summary values containing delimiters', () => {
+    expect(generateCSV(baseReport).split('\n')).toContain('Project,"Acme, Inc."');
+  });
+
+  it('emits only the summary when there are no findings', () => {
+    const lines = generateCSV({ ...baseReport, findings: [] }).split('\n');
+
+    expect(lines).toHaveLength(12);
+    expect(lines[lines.length - 1]).toMatch(/^ID,Title,/);
+  });
+});
@@ -31,70 +31,108 @@ export interface ReportData {
   findings: Finding[];
 }
 
+const CSV_FINDING_HEADERS = [
+  'ID',
+  'Title',
+  'Severity',
+  'Status',
+  'Category',
+  'CVE ID',
+  'CVSS Score',
+  'Description',
+  'Remediation',
+].join(',');
+
+const CSV_SPECIAL_CHARS = /[",\r\n]/;
+
+/**
+ * Escape a single CSV cell (RFC 4180): quote only when the value contains
+ * a delimiter, quote or line break, doubling embedded quotes.
+ */
+function csvCell(value: string): string {
+  return CSV_SPECIAL_CHARS.test(value) ? `"${value.replace(/"/g, '""')}"` : value;
+}
+
+/**
+ * Free-text cells are flattened to one line so each finding stays on one row
+ */
+function csvTextCell(value: string | undefined): string {
+  return csvCell((value || '').replace(/\r?\n/g, ' '));
+}
+
 /**
  * Generate CSV content from findings
+ * Lines are emitted in a single pass and joined once.
  */
 export function generateCSV(reportData: ReportData): string {
-  const headers = [
-    'ID',
-    'Title',
-    'Severity',
-    'Status',
-    'Category',
-    'CVE ID',
-    'CVSS Score',
-    'Description',
-    'Remediation',
-  ];
+  const { severity_distribution: dist, findings } = reportData;
 
-  const rows = reportData.findings.map((f) => [
-    f.id,
-    `"${(f.title || '').replace(/"/g, '""')}"`,
-    f.severity,
-    f.status,
-    f.category || 'N/A',
-    f.cve_id || 'N/A',
-    f.cvss_score?.toString() || 'N/A',
-    `"${(f.description || '').replace(/"/g, '""').replace(/\n/g, ' ')}"`,
-    `"${(f.remediation || '').replace(/"/g, '""').replace(/\n/g, ' ')}"`,
-  ]);
-
-  // Add summary section at top
-  const summary = [
-    ['Scan Report Summary'],
-    ['Target URL', reportData.target_url],
-    ['Project', reportData.project_name || 'N/A'],
-    ['Scan Date', new Date(reportData.created_at).toLocaleString()],
-    ['Total Findings', reportData.findings.length.toString()],
-    ['Critical', reportData.severity_distribution.critical.toString()],
-    ['High', reportData.severity_distribution.high.toString()],
-    ['Medium', reportData.severity_distribution.medium.toString()],
-    ['Low', reportData.severity_distribution.low.toString()],
-    [''],
-    ['Detailed Findings'],
-    headers,
+  // Summary section at top
+  const lines: string[] = [
+    'Scan Report Summary',
+    `Target URL,${csvCell(reportData.target_url)}`,
+    `Project,${csvCell(reportData.project_name || 'N/A')}`,
+    `Scan Date,${csvCell(new Date(reportData.created_at).toLocaleString())}`,
+    `Total Findings,${findings.length}`,
+    `Critical,${dist.critical}`,
+    `High,${dist.high}`,
+    `Medium,${dist.medium}`,
+    `Low,${dist.low}`,
+    '',
+    'Detailed Findings',
+    CSV_FINDING_HEADERS,
   ];
 
-  const allRows = [...summary, ...rows];
-  return allRows.map((row) => row.join(',')).join('\n');
+  for (const f of findings) {
+    lines.push(
+      [
+        csvCell(f.id),
+        csvTextCell(f.title),
+        f.severity,
+        f.status,
+        csvCell(f.category || 'N/A'),
+        csvCell(f.cve_id || 'N/A'),
+        f.cvss_score?.toString() || 'N/A',
+        csvTextCell(f.description),
+        csvTextCell(f.remediation),
+      ].join(',')
+    );
+  }
+
+  return lines.join('\n');
 }
 
 /**
- * Download CSV file
+ * Trigger a browser download for an in-memory blob
  */
-export function downloadCSV(reportData: ReportData, filename?: string): void {
-  const csvContent = generateCSV(reportData);
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+function downloadBlob(blob: Blob, filename: string): void {
   const url = URL.createObjectURL(blob);
   const link = document.createElement('a');
   link.href = url;
-  link.download = filename || `scan-report-${reportData.id}.csv`;
+  link.download = filename;
   document.body.appendChild(link);
   link.click();
   document.body.removeChild(link);
   URL.revokeObjectURL(url);
 }
 
+/**
+ * Download CSV file
+ */
+export function downloadCSV(reportData: ReportData, filename?: string): void {
+  const csvContent = generateCSV(reportData);
+  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+  downloadBlob(blob, filename || `scan-report-${reportData.id}.csv`);
+}
+
+/**
+ * Download any serializable value as a pretty-printed JSON file
+ */
+export function downloadJSON(data: unknown, filename: string): void {
+  const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+  downloadBlob(blob, filename);
+}
+
 /**
  * Generate PDF using browser print functionality
  * Opens a print dialog with the current page styled for printing
@@ -1,3 +1,4 @@
+import { cache } from 'react';
 import { createServerClient } from '@supabase/ssr';
 import { cookies } from 'next/headers';
 import { env } from '@/lib/env';
@@ -34,3 +35,22 @@ export function createClient(persistSession = false) {
     },
   });
 }
+
+/**
+ * Request-scoped client for Server Component data loaders.
+ * React's cache() memoizes per server request, so all loaders rendering a page
+ * share one client instead of each re-reading cookies and building its own.
+ */
+export const getServerClient = cache(() => createClient());
+
+/**
+ * Authenticated user for the current server request.
+ * getUser() round-trips to Supabase Auth to verify the session, so it runs at most
+ * once per request no matter how many server components ask for it.
+ */
+export const getCurrentUser = cache(async () => {
+  const {
+    data: { user },
+  } = await getServerClient().auth.getUser();
+  return user;
+});
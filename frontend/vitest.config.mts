@@ -10,7 +10,16 @@ export default defineConfig({
   plugins: [react()],
   test: {
     environment: 'jsdom',
+    // Pure logic suites don't touch the DOM; skip building a jsdom window for them
+    environmentMatchGlobs: [
+      ['src/tests/lib/**', 'node'],
+      ['src/tests/utils/**', 'node'],
+    ],
     globals: true,
+    // Reuse one worker module graph for the whole run instead of re-importing per file.
+    // Suites must not leave global state behind: stub globals with vi.stubGlobal and undo
+    // them in teardown (api.test restores fetch with vi.unstubAllGlobals)
+    isolate: false,
     setupFiles: './src/tests/setup.ts',
     alias: {
       '@': path.resolve(__dirname, './src'),